@@ -13,7 +13,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from src.agent.service_agent import ServiceAgent
-from src.api.server import APIServer
+from src.api.server import get_api_server
 from src.core.config_manager import ConfigManager
 
 
@@ -115,7 +115,7 @@ def run_api_mode(config_path: str):
         setup_logging(config)
         
         # Create and run API server
-        api_server = APIServer(config_path)
+        api_server = get_api_server(config_path)
         api_server.run(
             host=api_config.get("host", "0.0.0.0"),
             port=api_config.get("port", 8000),
@@ -2,42 +2,103 @@
 Main ServiceAgent class using LangGraph for orchestration.
 """
 import asyncio
+import inspect
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from dataclasses import asdict
+from typing import Dict, Any, AsyncIterator, List, Literal, Optional
+from string import Template
 
+import httpx
+import msgspec
+import orjson
 from langgraph import StateGraph, END
+from langgraph.types import Command
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig
 
-from ..core.state import AgentState, AgentRole, create_initial_state, add_message, add_tool_result, update_iteration, mark_complete
+from ..core.state import AgentState, AgentRole, Message, ToolResult, create_initial_state, serialize_message, update_iteration, mark_complete
 from ..core.config_manager import ConfigManager
 from ..tool_extensions.tool_registry import tool_registry
 from ..mcp_extensions.mcp_registry import mcp_registry
 
 
+# System prompt for input analysis (string.Template so the literal JSON braces need no escaping)
+ANALYZE_PROMPT = Template("""You are an AI assistant that analyzes user requests and determines what tools or MCP servers need to be used.
+
+Available tools: $tools
+Available MCP servers: $mcp_servers
+
+Analyze the user's request and determine:
+1. What tools need to be executed (if any)
+2. What MCP servers need to be called (if any)
+3. What the next step should be
+
+Respond with a JSON object containing:
+{
+    "tools_to_execute": [{"name": "tool_name", "params": {...}}],
+    "mcp_requests": [{"server": "server_name", "method": "method_name", "params": {...}}],
+    "reasoning": "explanation of your analysis"
+}""")
+
+# System prompt for response generation
+RESPONSE_PROMPT = Template("""You are an AI assistant that generates helpful responses based on tool execution results and MCP server responses.
+
+Use the following information to generate a comprehensive response:
+- Tool execution results: $tool_results
+- MCP server responses: $mcp_results
+- Original user request: $user_input
+
+Provide a clear, helpful response that addresses the user's request using the available information.""")
+
+
+def _agent_node(method_name: str):
+    """Create a graph node that dispatches to the agent passed in the run config."""
+    async def node(state: AgentState, config: RunnableConfig):
+        result = getattr(config["configurable"]["agent"], method_name)(state)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    
+    node.__name__ = method_name.lstrip("_")
+    return node
+
+
 class ServiceAgent:
     """Main service agent using LangGraph for orchestration."""
     
+    # Compiled workflow shared by all instances; the topology does not depend on config
+    _workflow = None
+    
     def __init__(self, config_path: str = "config/agent_config.yaml"):
         self.config_manager = ConfigManager(config_path)
         self.config = self.config_manager.load_config()
         self.logger = logging.getLogger(__name__)
         
+        # Pooled HTTP client so LLM calls reuse keep-alive connections
+        self._http = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200)
+        )
+        
         # Initialize LLM
         agent_config = self.config_manager.get_agent_config()
         self.llm = ChatOpenAI(
             model=agent_config.get("model", "gpt-4"),
             temperature=agent_config.get("temperature", 0.1),
-            max_tokens=agent_config.get("max_tokens", 2000)
+            max_tokens=agent_config.get("max_tokens", 2000),
+            http_async_client=self._http
         )
         
+        # Analysis output is constrained to a JSON object by the API
+        self.analysis_llm = self.llm.bind(response_format={"type": "json_object"})
+        
         # Initialize tool and MCP registries
         self._initialize_extensions()
         
-        # Create LangGraph workflow
-        self.workflow = self._create_workflow()
+        # Get the shared LangGraph workflow; nodes resolve this agent from the run config
+        self.workflow = self._get_workflow()
+        self._run_config: RunnableConfig = {"configurable": {"agent": self}}
         
         self.logger.info("ServiceAgent initialized successfully")
     
@@ -53,16 +114,24 @@ class ServiceAgent:
             mcp_registry.load_servers_from_directory("src/mcp_extensions", self.config_manager)
             self.logger.info(f"Loaded {len(mcp_registry.list_enabled_servers())} enabled MCP servers")
     
-    def _create_workflow(self) -> StateGraph:
+    @classmethod
+    def _get_workflow(cls):
+        """Get the compiled workflow, building it on first use."""
+        if cls._workflow is None:
+            cls._workflow = cls._create_workflow()
+        return cls._workflow
+    
+    @staticmethod
+    def _create_workflow():
         """Create the LangGraph workflow."""
         workflow = StateGraph(AgentState)
         
         # Add nodes
-        workflow.add_node("analyze_input", self._analyze_input)
-        workflow.add_node("execute_tools", self._execute_tools)
-        workflow.add_node("execute_mcp", self._execute_mcp)
-        workflow.add_node("generate_response", self._generate_response)
-        workflow.add_node("check_completion", self._check_completion)
+        workflow.add_node("analyze_input", _agent_node("_analyze_input"))
+        workflow.add_node("execute_tools", _agent_node("_execute_tools"))
+        workflow.add_node("execute_mcp", _agent_node("_execute_mcp"))
+        workflow.add_node("generate_response", _agent_node("_generate_response"))
+        workflow.add_node("check_completion", _agent_node("_check_completion"))
         
         # Add edges
         workflow.add_edge("analyze_input", "execute_tools")
@@ -70,52 +139,28 @@ class ServiceAgent:
         workflow.add_edge("execute_mcp", "generate_response")
         workflow.add_edge("generate_response", "check_completion")
         
-        # Add conditional edges
-        workflow.add_conditional_edges(
-            "check_completion",
-            self._should_continue,
-            {
-                "continue": "analyze_input",
-                "end": END
-            }
-        )
+        # check_completion routes itself via Command(goto=...)
         
         # Set entry point
         workflow.set_entry_point("analyze_input")
         
         return workflow.compile()
     
-    def _analyze_input(self, state: AgentState) -> AgentState:
+    async def _analyze_input(self, state: AgentState) -> Dict[str, Any]:
         """Analyze user input and determine required actions."""
+        # Clear the previous turn's requests so a failed analysis runs nothing
+        update: Dict[str, Any] = {"tools_to_execute": [], "mcp_requests": []}
+        # Add user message to conversation
+        new_messages = [Message(role=AgentRole.USER, content=state.user_input)]
         try:
-            # Add user message to conversation
-            state = add_message(state, AgentRole.USER, state.user_input)
             
-            # Create system prompt for analysis
-            system_prompt = """You are an AI assistant that analyzes user requests and determines what tools or MCP servers need to be used.
-
-Available tools: {tools}
-Available MCP servers: {mcp_servers}
-
-Analyze the user's request and determine:
-1. What tools need to be executed (if any)
-2. What MCP servers need to be called (if any)
-3. What the next step should be
-
-Respond with a JSON object containing:
-{
-    "tools_to_execute": [{"name": "tool_name", "params": {...}}],
-    "mcp_requests": [{"server": "server_name", "method": "method_name", "params": {...}}],
-    "reasoning": "explanation of your analysis"
-}"""
-
             # Get available tools and MCP servers
             tools = tool_registry.list_enabled_tools()
             mcp_servers = mcp_registry.list_enabled_servers()
             
             # Create messages for analysis
             messages = [
-                SystemMessage(content=system_prompt.format(
+                SystemMessage(content=ANALYZE_PROMPT.substitute(
                     tools=tools,
                     mcp_servers=mcp_servers
                 )),
@@ -123,73 +168,76 @@ Respond with a JSON object containing:
             ]
             
             # Get analysis from LLM
-            response = self.llm.invoke(messages)
+            response = await self.analysis_llm.ainvoke(messages)
             
             # Parse response and update state
             try:
-                import json
-                analysis = json.loads(response.content)
-                state.memory["analysis"] = analysis
-                state.memory["tools_to_execute"] = analysis.get("tools_to_execute", [])
-                state.memory["mcp_requests"] = analysis.get("mcp_requests", [])
-            except json.JSONDecodeError:
+                analysis = orjson.loads(response.content)
+                update["analysis"] = analysis
+                update["tools_to_execute"] = analysis.get("tools_to_execute", [])
+                update["mcp_requests"] = analysis.get("mcp_requests", [])
+            except orjson.JSONDecodeError:
                 self.logger.warning("Failed to parse LLM analysis response")
-                state.memory["tools_to_execute"] = []
-                state.memory["mcp_requests"] = []
             
             # Add assistant message
-            state = add_message(state, AgentRole.ASSISTANT, response.content)
+            new_messages.append(Message(role=AgentRole.ASSISTANT, content=response.content))
             
         except Exception as e:
             self.logger.error(f"Error in analyze_input: {e}")
-            state.error = str(e)
+            update["error"] = str(e)
         
-        return state
+        update["messages"] = new_messages
+        return update
     
-    def _execute_tools(self, state: AgentState) -> AgentState:
-        """Execute required tools."""
+    async def _execute_tools(self, state: AgentState) -> Dict[str, Any]:
+        """Execute required tools concurrently."""
+        update: Dict[str, Any] = {}
+        tool_results: List[ToolResult] = []
         try:
-            tools_to_execute = state.memory.get("tools_to_execute", [])
+            enabled_tools = tool_registry.list_enabled_tools()
+            requests = [
+                (tool_request.get("name"), tool_request.get("params", {}))
+                for tool_request in state.tools_to_execute
+            ]
+            requests = [(name, params) for name, params in requests if name and name in enabled_tools]
             
-            for tool_request in tools_to_execute:
-                tool_name = tool_request.get("name")
-                params = tool_request.get("params", {})
-                
-                if tool_name and tool_name in tool_registry.list_enabled_tools():
-                    try:
-                        result = tool_registry.execute_tool(tool_name, **params)
-                        state = add_tool_result(state, result)
-                        
-                        # Add tool result to memory
-                        if "tool_results" not in state.memory:
-                            state.memory["tool_results"] = []
-                        state.memory["tool_results"].append({
-                            "tool": tool_name,
-                            "result": result.dict()
-                        })
-                        
-                    except Exception as e:
-                        self.logger.error(f"Error executing tool {tool_name}: {e}")
-                        error_result = {
-                            "tool": tool_name,
-                            "error": str(e)
-                        }
-                        if "tool_results" not in state.memory:
-                            state.memory["tool_results"] = []
-                        state.memory["tool_results"].append(error_result)
+            # Tools run on worker threads; results come back in request order
+            outcomes = await asyncio.gather(
+                *(tool_registry.aexecute_tool(name, **params) for name, params in requests),
+                return_exceptions=True
+            )
+            
+            for (tool_name, _), result in zip(requests, outcomes):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error executing tool {tool_name}: {result}")
+                    tool_results.append(ToolResult(
+                        tool_name=tool_name,
+                        success=False,
+                        result=None,
+                        error=str(result)
+                    ))
+                else:
+                    tool_results.append(ToolResult(
+                        tool_name=tool_name,
+                        success=result.success,
+                        result=result.result,
+                        error=result.error,
+                        execution_time=result.execution_time
+                    ))
             
         except Exception as e:
             self.logger.error(f"Error in execute_tools: {e}")
-            state.error = str(e)
+            update["error"] = str(e)
         
-        return state
+        update["tool_results"] = tool_results
+        return update
     
-    async def _execute_mcp(self, state: AgentState) -> AgentState:
+    async def _execute_mcp(self, state: AgentState) -> Dict[str, Any]:
         """Execute MCP server requests."""
+        update: Dict[str, Any] = {}
+        mcp_results: List[Dict[str, Any]] = []
         try:
-            mcp_requests = state.memory.get("mcp_requests", [])
-            
-            for mcp_request in mcp_requests:
+            for mcp_request in state.mcp_requests:
                 server_name = mcp_request.get("server")
                 method = mcp_request.get("method")
                 params = mcp_request.get("params", {})
@@ -200,13 +248,10 @@ Respond with a JSON object containing:
                         request = MCPRequest(method=method, params=params)
                         response = await mcp_registry.handle_request(server_name, request)
                         
-                        # Add MCP result to memory
-                        if "mcp_results" not in state.memory:
-                            state.memory["mcp_results"] = []
-                        state.memory["mcp_results"].append({
+                        mcp_results.append({
                             "server": server_name,
                             "method": method,
-                            "result": response.dict()
+                            "result": msgspec.structs.asdict(response)
                         })
                         
                     except Exception as e:
@@ -216,60 +261,44 @@ Respond with a JSON object containing:
                             "method": method,
                             "error": str(e)
                         }
-                        if "mcp_results" not in state.memory:
-                            state.memory["mcp_results"] = []
-                        state.memory["mcp_results"].append(error_result)
+                        mcp_results.append(error_result)
             
         except Exception as e:
             self.logger.error(f"Error in execute_mcp: {e}")
-            state.error = str(e)
+            update["error"] = str(e)
         
-        return state
+        update["mcp_results"] = mcp_results
+        return update
     
-    def _generate_response(self, state: AgentState) -> AgentState:
+    async def _generate_response(self, state: AgentState) -> Dict[str, Any]:
         """Generate final response based on tool and MCP results."""
+        update: Dict[str, Any] = {}
         try:
-            # Create system prompt for response generation
-            system_prompt = """You are an AI assistant that generates helpful responses based on tool execution results and MCP server responses.
-
-Use the following information to generate a comprehensive response:
-- Tool execution results: {tool_results}
-- MCP server responses: {mcp_results}
-- Original user request: {user_input}
-
-Provide a clear, helpful response that addresses the user's request using the available information."""
-
-            # Prepare context for response generation
-            tool_results = state.memory.get("tool_results", [])
-            mcp_results = state.memory.get("mcp_results", [])
-            
             # Create messages for response generation
             messages = [
-                SystemMessage(content=system_prompt.format(
-                    tool_results=tool_results,
-                    mcp_results=mcp_results,
+                SystemMessage(content=RESPONSE_PROMPT.substitute(
+                    tool_results=state.tool_results,
+                    mcp_results=state.mcp_results,
                     user_input=state.user_input
                 )),
                 HumanMessage(content=state.user_input)
             ]
             
             # Generate response
-            response = self.llm.invoke(messages)
+            response = await self.llm.ainvoke(messages)
             
             # Add assistant response to conversation
-            state = add_message(state, AgentRole.ASSISTANT, response.content)
-            
-            # Store final response in memory
-            state.memory["final_response"] = response.content
+            update["messages"] = [Message(role=AgentRole.ASSISTANT, content=response.content)]
+            update["final_response"] = response.content
             
         except Exception as e:
             self.logger.error(f"Error in generate_response: {e}")
-            state.error = str(e)
+            update["error"] = str(e)
         
-        return state
+        return update
     
-    def _check_completion(self, state: AgentState) -> AgentState:
-        """Check if the workflow should continue or end."""
+    def _check_completion(self, state: AgentState) -> Command[Literal["analyze_input", "__end__"]]:
+        """Check completion and route to the next iteration or the end of the workflow."""
         try:
             # Update iteration count
             state = update_iteration(state)
@@ -277,30 +306,28 @@ Provide a clear, helpful response that addresses the user's request using the av
             # Check if max iterations reached
             if state.iteration >= state.max_iterations:
                 state = mark_complete(state, "Maximum iterations reached")
-                return state
             
             # Check if there's an error
-            if state.error:
+            elif state.error:
                 state = mark_complete(state, state.error)
-                return state
             
             # Check if response is complete (simple heuristic)
-            final_response = state.memory.get("final_response", "")
-            if len(final_response) > 50:  # Simple completion check
+            elif len(state.final_response) > 50:  # Simple completion check
                 state = mark_complete(state)
             
         except Exception as e:
             self.logger.error(f"Error in check_completion: {e}")
             state.error = str(e)
         
-        return state
-    
-    def _should_continue(self, state: AgentState) -> str:
-        """Determine if the workflow should continue."""
-        if state.is_complete:
-            return "end"
-        else:
-            return "continue"
+        return Command(
+            update={
+                "iteration": state.iteration,
+                "is_complete": state.is_complete,
+                "end_time_ns": state.end_time_ns,
+                "error": state.error
+            },
+            goto=END if state.is_complete else "analyze_input"
+        )
     
     async def process_request(self, user_input: str) -> Dict[str, Any]:
         """Process a user request through the agent workflow."""
@@ -309,19 +336,20 @@ Provide a clear, helpful response that addresses the user's request using the av
             initial_state = create_initial_state(self.config)
             initial_state.user_input = user_input
             
-            # Run the workflow
-            final_state = await self.workflow.ainvoke(initial_state)
+            # Run the workflow (the compiled graph returns the final channel values as a dict)
+            final_state = await self.workflow.ainvoke(initial_state, self._run_config)
+            end_time_ns = final_state.get("end_time_ns")
             
             # Prepare response
             response = {
-                "success": not bool(final_state.error),
-                "response": final_state.memory.get("final_response", ""),
-                "conversation": [msg.dict() for msg in final_state.messages],
-                "tool_results": final_state.memory.get("tool_results", []),
-                "mcp_results": final_state.memory.get("mcp_results", []),
-                "iterations": final_state.iteration,
-                "error": final_state.error,
-                "execution_time": (final_state.end_time - final_state.start_time).total_seconds() if final_state.end_time else None
+                "success": not bool(final_state.get("error")),
+                "response": final_state.get("final_response", ""),
+                "conversation": [serialize_message(msg) for msg in final_state.get("messages", [])],
+                "tool_results": [asdict(result) for result in final_state.get("tool_results", [])],
+                "mcp_results": final_state.get("mcp_results", []),
+                "iterations": final_state.get("iteration", 0),
+                "error": final_state.get("error"),
+                "execution_time": (end_time_ns - initial_state.start_time_ns) / 1e9 if end_time_ns else None
             }
             
             return response
@@ -334,6 +362,17 @@ Provide a clear, helpful response that addresses the user's request using the av
                 "response": "An error occurred while processing your request."
             }
     
+    async def stream_request(self, user_input: str) -> AsyncIterator[str]:
+        """Process a user request and stream the generated response as it arrives."""
+        # Create initial state
+        initial_state = create_initial_state(self.config)
+        initial_state.user_input = user_input
+        
+        # Token chunks from the LLM call in generate_response are the user-facing output
+        async for chunk, metadata in self.workflow.astream(initial_state, self._run_config, stream_mode="messages"):
+            if metadata.get("langgraph_node") == "generate_response" and chunk.content:
+                yield chunk.content
+    
     async def initialize(self):
         """Initialize the agent and all extensions."""
         try:
@@ -354,6 +393,9 @@ Provide a clear, helpful response that addresses the user's request using the av
             if mcp_registry.server_instances:
                 await mcp_registry.cleanup_all_servers()
             
+            # Close pooled LLM connections
+            await self._http.aclose()
+            
             self.logger.info("ServiceAgent cleanup completed")
             
         except Exception as e:
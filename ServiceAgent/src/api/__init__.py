@@ -1,6 +1,6 @@
 """
 API package for the ServiceAgent.
 """
-from .server import APIServer
+from .server import APIServer, get_api_server
 
-__all__ = ["APIServer"] 
\ No newline at end of file
+__all__ = ["APIServer", "get_api_server"] 
\ No newline at end of file
@@ -6,6 +6,7 @@ import logging
 from typing import Dict, Any, Optional
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 import uvicorn
 
@@ -50,7 +51,8 @@ class APIServer:
         self.app = FastAPI(
             title="ServiceAgent API",
             description="API for the LangGraph-based ServiceAgent",
-            version="1.0.0"
+            version="1.0.0",
+            default_response_class=ORJSONResponse
         )
         
         # Add CORS middleware
@@ -94,11 +96,23 @@ class APIServer:
             
             try:
                 result = await self.agent.process_request(request.user_input)
-                return ProcessResponse(**result)
+                # orjson encodes datetimes and enums natively, so skip re-validating into ProcessResponse
+                return ORJSONResponse(result)
             except Exception as e:
                 self.logger.error(f"Error processing request: {e}")
                 raise HTTPException(status_code=500, detail=str(e))
         
+        @self.app.post("/stream")
+        async def stream_request(request: ProcessRequest):
+            """Process a user request and stream the response."""
+            if not self.agent:
+                raise HTTPException(status_code=503, detail="Agent not initialized")
+            
+            return StreamingResponse(
+                self.agent.stream_request(request.user_input),
+                media_type="text/plain"
+            )
+        
         @self.app.get("/status", response_model=StatusResponse)
         async def get_status():
             """Get agent status."""
@@ -163,5 +177,13 @@ class APIServer:
         )
 
 
-# Create global API server instance
-api_server = APIServer() 
\ No newline at end of file
+# Lazily created API server instance
+_instance: Optional[APIServer] = None
+
+
+def get_api_server(config_path: str = "config/agent_config.yaml") -> APIServer:
+    """Get the shared API server, creating it on first call."""
+    global _instance
+    if _instance is None:
+        _instance = APIServer(config_path)
+    return _instance
@@ -2,19 +2,67 @@
 Configuration manager for the agent.
 """
 import os
+import re
 import yaml
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import logging
 
 
+# Matches ${VAR} references anywhere inside a configuration string
+_ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
+
+def _substitute_env(match: "re.Match[str]") -> str:
+    """Replace a single ${VAR} match with its environment value."""
+    return os.getenv(match.group(1), "")
+
+
+class AgentSection(BaseModel):
+    """Schema for the agent configuration section."""
+    model_config = ConfigDict(extra="allow")
+    
+    model: str = Field(min_length=1)
+
+
+class ToolExtensionsSection(BaseModel):
+    """Schema for the tool extensions configuration section."""
+    model_config = ConfigDict(extra="allow")
+    
+    enabled: bool = False
+    tools: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+
+
+class MCPExtensionsSection(BaseModel):
+    """Schema for the MCP extensions configuration section."""
+    model_config = ConfigDict(extra="allow")
+    
+    enabled: bool = False
+    servers: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+
+
+class AgentConfigModel(BaseModel):
+    """Schema for the full agent configuration file."""
+    model_config = ConfigDict(extra="allow")
+    
+    agent: AgentSection
+    tool_extensions: ToolExtensionsSection
+    mcp_extensions: MCPExtensionsSection
+    behavior: Dict[str, Any]
+
+
 class ConfigManager:
     """Manages agent configuration loading and validation."""
     
     def __init__(self, config_path: str = "config/agent_config.yaml"):
         self.config_path = Path(config_path)
         self.config: Dict[str, Any] = {}
+        self._model: Optional[AgentConfigModel] = None
+        self._tool_index: Dict[str, Dict[str, Any]] = {}
+        self._mcp_index: Dict[str, Dict[str, Any]] = {}
+        self._cfg_rev = 0
+        self._enabled_cache: Dict[str, Tuple[int, List[str]]] = {}
         self.logger = logging.getLogger(__name__)
         
     def load_config(self) -> Dict[str, Any]:
@@ -32,6 +80,13 @@ class ConfigManager:
             # Validate configuration
             self._validate_config()
             
+            # Flatten per-tool and per-server lookups
+            self._tool_index = self.config.get("tool_extensions", {}).get("tools", {})
+            self._mcp_index = self.config.get("mcp_extensions", {}).get("servers", {})
+            
+            # Invalidate memoized lookups
+            self._cfg_rev += 1
+            
             self.logger.info(f"Configuration loaded successfully from {self.config_path}")
             return self.config
             
@@ -40,38 +95,27 @@ class ConfigManager:
             raise
     
     def _resolve_env_vars(self):
-        """Resolve environment variables in configuration values."""
-        def resolve_value(value):
-            if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                env_var = value[2:-1]
-                return os.getenv(env_var, "")
-            elif isinstance(value, dict):
-                return {k: resolve_value(v) for k, v in value.items()}
-            elif isinstance(value, list):
-                return [resolve_value(v) for v in value]
-            else:
-                return value
-        
-        self.config = resolve_value(self.config)
+        """Resolve environment variables in configuration values in place."""
+        stack = [self.config] if isinstance(self.config, (dict, list)) else []
+        while stack:
+            node = stack.pop()
+            items = node.items() if isinstance(node, dict) else enumerate(node)
+            for key, value in items:
+                if isinstance(value, str):
+                    if "${" in value:
+                        node[key] = _ENV_VAR_PATTERN.sub(_substitute_env, value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
     
     def _validate_config(self):
         """Validate the loaded configuration."""
-        required_sections = ["agent", "tool_extensions", "mcp_extensions", "behavior"]
-        
-        for section in required_sections:
-            if section not in self.config:
-                raise ValueError(f"Missing required configuration section: {section}")
-        
-        # Validate agent configuration
-        agent_config = self.config.get("agent", {})
-        if not agent_config.get("model"):
-            raise ValueError("Agent model is required")
+        # Required sections and the agent model are checked in a single pass
+        self._model = AgentConfigModel.model_validate(self.config)
         
         # Validate tool extensions
-        tool_config = self.config.get("tool_extensions", {})
-        if tool_config.get("enabled", False):
-            tools = tool_config.get("tools", {})
-            for tool_name, tool_config in tools.items():
+        tool_extensions = self._model.tool_extensions
+        if tool_extensions.enabled:
+            for tool_name, tool_config in tool_extensions.tools.items():
                 if tool_config.get("enabled", False):
                     # Check for required API keys
                     if "api_key" in tool_config and not tool_config["api_key"]:
@@ -79,13 +123,11 @@ class ConfigManager:
     
     def get_tool_config(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """Get configuration for a specific tool."""
-        tools = self.config.get("tool_extensions", {}).get("tools", {})
-        return tools.get(tool_name, {})
+        return self._tool_index.get(tool_name, {})
     
     def get_mcp_config(self, server_name: str) -> Optional[Dict[str, Any]]:
         """Get configuration for a specific MCP server."""
-        servers = self.config.get("mcp_extensions", {}).get("servers", {})
-        return servers.get(server_name, {})
+        return self._mcp_index.get(server_name, {})
     
     def is_tool_enabled(self, tool_name: str) -> bool:
         """Check if a tool is enabled."""
@@ -99,13 +141,23 @@ class ConfigManager:
     
     def get_enabled_tools(self) -> list[str]:
         """Get list of enabled tools."""
-        tools = self.config.get("tool_extensions", {}).get("tools", {})
-        return [name for name, config in tools.items() if config.get("enabled", False)]
+        cached_rev, enabled = self._enabled_cache.get("tools", (-1, None))
+        if cached_rev == self._cfg_rev:
+            return enabled
+        
+        enabled = [name for name, config in self._tool_index.items() if config.get("enabled", False)]
+        self._enabled_cache["tools"] = (self._cfg_rev, enabled)
+        return enabled
     
     def get_enabled_mcp_servers(self) -> list[str]:
         """Get list of enabled MCP servers."""
-        servers = self.config.get("mcp_extensions", {}).get("servers", {})
-        return [name for name, config in servers.items() if config.get("enabled", False)]
+        cached_rev, enabled = self._enabled_cache.get("mcp_servers", (-1, None))
+        if cached_rev == self._cfg_rev:
+            return enabled
+        
+        enabled = [name for name, config in self._mcp_index.items() if config.get("enabled", False)]
+        self._enabled_cache["mcp_servers"] = (self._cfg_rev, enabled)
+        return enabled
     
     def get_agent_config(self) -> Dict[str, Any]:
         """Get agent configuration."""
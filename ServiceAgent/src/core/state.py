@@ -1,12 +1,24 @@
 """
 Core state management for the LangGraph agent.
 """
-from typing import Dict, List, Any, Optional
-from pydantic import BaseModel, Field
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Annotated, Dict, List, Any, Optional
 from datetime import datetime
 from enum import Enum
 
 
+def extend_list(current: List[Any], new: List[Any]) -> List[Any]:
+    """State reducer that concatenates lists without mutating either side.
+    
+    Node updates with nothing to add return the existing list as is, so only
+    updates that actually contribute items pay for a copy.
+    """
+    if not new:
+        return current
+    return current + new
+
+
 class AgentRole(str, Enum):
     """Agent roles for different types of operations."""
     USER = "user"
@@ -15,15 +27,18 @@ class AgentRole(str, Enum):
     TOOL = "tool"
 
 
-class Message(BaseModel):
+@dataclass
+class Message:
     """Message structure for the agent conversation."""
     role: AgentRole
     content: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    # Epoch seconds; formatted as ISO 8601 only when serialized
+    timestamp: float = field(default_factory=time.time)
     metadata: Optional[Dict[str, Any]] = None
 
 
-class ToolResult(BaseModel):
+@dataclass
+class ToolResult:
     """Result from tool execution."""
     tool_name: str
     success: bool
@@ -32,19 +47,29 @@ class ToolResult(BaseModel):
     execution_time: float = 0.0
 
 
-class AgentState(BaseModel):
+@dataclass
+class AgentState:
     """Main state for the LangGraph agent."""
-    # Conversation history
-    messages: List[Message] = Field(default_factory=list)
+    # Conversation history (nodes return new messages, the reducer appends them)
+    messages: Annotated[List[Message], extend_list] = field(default_factory=list)
     
     # Current user input
     user_input: str = ""
     
-    # Tool execution results
-    tool_results: List[ToolResult] = Field(default_factory=list)
+    # Analysis of the current user input
+    analysis: Dict[str, Any] = field(default_factory=dict)
+    tools_to_execute: List[Dict[str, Any]] = field(default_factory=list)
+    mcp_requests: List[Dict[str, Any]] = field(default_factory=list)
+    
+    # Tool and MCP execution results (nodes return new entries, the reducer appends them)
+    tool_results: Annotated[List[ToolResult], extend_list] = field(default_factory=list)
+    mcp_results: Annotated[List[Dict[str, Any]], extend_list] = field(default_factory=list)
+    
+    # Final response for the user
+    final_response: str = ""
     
     # Agent configuration
-    config: Dict[str, Any] = Field(default_factory=dict)
+    config: Dict[str, Any] = field(default_factory=dict)
     
     # Current iteration count
     iteration: int = 0
@@ -53,7 +78,7 @@ class AgentState(BaseModel):
     max_iterations: int = 10
     
     # Agent memory/context
-    memory: Dict[str, Any] = Field(default_factory=dict)
+    memory: Dict[str, Any] = field(default_factory=dict)
     
     # Current task or goal
     current_task: Optional[str] = None
@@ -62,16 +87,13 @@ class AgentState(BaseModel):
     is_complete: bool = False
     error: Optional[str] = None
     
-    # Performance metrics
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
+    # Performance metrics (time.perf_counter_ns readings)
+    start_time_ns: Optional[int] = None
+    end_time_ns: Optional[int] = None
     
     # Tool and MCP extension status
-    enabled_tools: List[str] = Field(default_factory=list)
-    enabled_mcp_servers: List[str] = Field(default_factory=list)
-    
-    class Config:
-        arbitrary_types_allowed = True
+    enabled_tools: List[str] = field(default_factory=list)
+    enabled_mcp_servers: List[str] = field(default_factory=list)
 
 
 def create_initial_state(config: Dict[str, Any]) -> AgentState:
@@ -81,10 +103,17 @@ def create_initial_state(config: Dict[str, Any]) -> AgentState:
         max_iterations=config.get("behavior", {}).get("max_iterations", 10),
         enabled_tools=[],
         enabled_mcp_servers=[],
-        start_time=datetime.now()
+        start_time_ns=time.perf_counter_ns()
     )
 
 
+def serialize_message(message: Message) -> Dict[str, Any]:
+    """Convert a message to a dict with an ISO 8601 timestamp."""
+    data = asdict(message)
+    data["timestamp"] = datetime.fromtimestamp(message.timestamp).isoformat()
+    return data
+
+
 def add_message(state: AgentState, role: AgentRole, content: str, metadata: Optional[Dict[str, Any]] = None) -> AgentState:
     """Add a message to the conversation history."""
     message = Message(role=role, content=content, metadata=metadata)
@@ -107,7 +136,7 @@ def update_iteration(state: AgentState) -> AgentState:
 def mark_complete(state: AgentState, error: Optional[str] = None) -> AgentState:
     """Mark the agent execution as complete."""
     state.is_complete = True
-    state.end_time = datetime.now()
+    state.end_time_ns = time.perf_counter_ns()
     if error:
         state.error = error
     return state 
\ No newline at end of file
@@ -5,8 +5,8 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
 import logging
-import asyncio
-from datetime import datetime
+
+import msgspec
 
 
 class MCPServerSchema(BaseModel):
@@ -18,15 +18,15 @@ class MCPServerSchema(BaseModel):
     resources: List[Dict[str, Any]] = Field(default_factory=list)
 
 
-class MCPRequest(BaseModel):
-    """MCP request structure."""
+class MCPRequest(msgspec.Struct):
+    """MCP request structure (msgspec struct, built on every MCP call)."""
     method: str
     params: Dict[str, Any]
     id: Optional[str] = None
 
 
-class MCPResponse(BaseModel):
-    """MCP response structure."""
+class MCPResponse(msgspec.Struct):
+    """MCP response structure (msgspec struct, built on every MCP call)."""
     result: Any
     error: Optional[str] = None
     id: Optional[str] = None
@@ -35,9 +35,16 @@ class MCPResponse(BaseModel):
 class BaseMCPServer(ABC):
     """Base class for all MCP server extensions."""
     
+    logger = logging.getLogger(__name__)
+    
+    def __init_subclass__(cls, **kwargs):
+        """Resolve one logger per subclass at class creation."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(f"{__name__}.{cls.__name__}")
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._enabled = bool(config.get("enabled", False))
         self.name = self.__class__.__name__
         self.description = getattr(self, 'description', 'No description provided')
         self.version = getattr(self, 'version', '1.0.0')
@@ -94,7 +101,7 @@ class BaseMCPServer(ABC):
     
     def is_enabled(self) -> bool:
         """Check if the MCP server is enabled based on configuration."""
-        return self.config.get("enabled", False)
+        return self._enabled
     
     def get_config(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
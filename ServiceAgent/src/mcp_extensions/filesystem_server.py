@@ -1,9 +1,14 @@
 """
 Filesystem MCP server for file system operations.
 """
+import asyncio
 import os
+import stat
 from pathlib import Path
 from typing import Dict, Any, List
+
+import aiofiles
+
 from .base_mcp import BaseMCPServer, MCPServerSchema, MCPRequest, MCPResponse
 
 
@@ -13,35 +18,19 @@ class FilesystemServer(BaseMCPServer):
     description = "Provides filesystem operations through MCP"
     version = "1.0.0"
     
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        # Method name -> handler, resolved once per instance
+        self._dispatch = {
+            "read_file": self._read_file,
+            "write_file": self._write_file,
+            "list_directory": self._list_directory,
+            "file_exists": self._file_exists,
+            "get_file_info": self._get_file_info
+        }
+    
     def _create_schema(self) -> MCPServerSchema:
-        return MCPServerSchema(
-            name="FilesystemServer",
-            description=self.description,
-            version=self.version,
-            capabilities={
-                "methods": [
-                    "read_file",
-                    "write_file", 
-                    "list_directory",
-                    "file_exists",
-                    "get_file_info"
-                ],
-                "resources": [
-                    {
-                        "uri": "file://",
-                        "name": "filesystem",
-                        "description": "Local filesystem access"
-                    }
-                ]
-            },
-            resources=[
-                {
-                    "uri": "file://",
-                    "name": "filesystem",
-                    "description": "Local filesystem access"
-                }
-            ]
-        )
+        return _FILESYSTEM_SCHEMA
     
     async def connect(self) -> bool:
         """Connect to the filesystem (always available)."""
@@ -61,26 +50,16 @@ class FilesystemServer(BaseMCPServer):
     async def handle_request(self, request: MCPRequest) -> MCPResponse:
         """Handle filesystem MCP requests."""
         try:
-            method = request.method
-            params = request.params
-            
-            if method == "read_file":
-                result = await self._read_file(params)
-            elif method == "write_file":
-                result = await self._write_file(params)
-            elif method == "list_directory":
-                result = await self._list_directory(params)
-            elif method == "file_exists":
-                result = await self._file_exists(params)
-            elif method == "get_file_info":
-                result = await self._get_file_info(params)
-            else:
+            handler = self._dispatch.get(request.method)
+            if handler is None:
                 return MCPResponse(
                     result=None,
-                    error=f"Unknown method: {method}",
+                    error=f"Unknown method: {request.method}",
                     id=request.id
                 )
             
+            result = await handler(request.params)
+            
             return MCPResponse(
                 result=result,
                 id=request.id
@@ -100,19 +79,21 @@ class FilesystemServer(BaseMCPServer):
             raise ValueError("Path parameter is required")
         
         file_path = Path(path)
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
-        
-        if not file_path.is_file():
-            raise ValueError(f"Path is not a file: {path}")
+        try:
+            f = await aiofiles.open(file_path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}") from None
+        except IsADirectoryError:
+            raise ValueError(f"Path is not a file: {path}") from None
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        async with f:
+            content = await f.read()
+            size = os.fstat(f.fileno()).st_size
         
         return {
             "content": content,
-            "path": str(file_path.absolute()),
-            "size": file_path.stat().st_size
+            "path": os.path.abspath(file_path),
+            "size": size
         }
     
     async def _write_file(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -124,19 +105,25 @@ class FilesystemServer(BaseMCPServer):
             raise ValueError("Path parameter is required")
         
         file_path = Path(path)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(file_path.parent.mkdir, parents=True, exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Encode once; the same bytes are written and measured
+        data = content.encode('utf-8')
+        async with aiofiles.open(file_path, 'wb') as f:
+            await f.write(data)
         
         return {
-            "path": str(file_path.absolute()),
-            "size": len(content.encode('utf-8')),
+            "path": os.path.abspath(file_path),
+            "size": len(data),
             "written": True
         }
     
     async def _list_directory(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """List directory contents."""
+        return await asyncio.to_thread(self._list_directory_sync, params)
+    
+    def _list_directory_sync(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """List directory contents (blocking)."""
         path = params.get("path", ".")
         
         dir_path = Path(path)
@@ -146,55 +133,102 @@ class FilesystemServer(BaseMCPServer):
         if not dir_path.is_dir():
             raise ValueError(f"Path is not a directory: {path}")
         
+        # DirEntry type checks use the cached directory listing; only files need a stat
         items = []
-        for item in dir_path.iterdir():
-            item_info = {
-                "name": item.name,
-                "type": "directory" if item.is_dir() else "file",
-                "size": item.stat().st_size if item.is_file() else None
-            }
-            items.append(item_info)
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                is_file = entry.is_file()
+                items.append({
+                    "name": entry.name,
+                    "type": "directory" if entry.is_dir() else "file",
+                    "size": entry.stat().st_size if is_file else None
+                })
         
         return {
-            "path": str(dir_path.absolute()),
+            "path": os.path.abspath(dir_path),
             "items": items,
             "total": len(items)
         }
     
     async def _file_exists(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Check if file exists."""
+        return await asyncio.to_thread(self._file_exists_sync, params)
+    
+    def _file_exists_sync(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Check if file exists (blocking)."""
         path = params.get("path")
         if not path:
             raise ValueError("Path parameter is required")
         
         file_path = Path(path)
         
+        # One stat call answers all three questions
+        try:
+            mode = os.stat(file_path).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            mode = None
+        
         return {
-            "path": str(file_path.absolute()),
-            "exists": file_path.exists(),
-            "is_file": file_path.is_file() if file_path.exists() else False,
-            "is_dir": file_path.is_dir() if file_path.exists() else False
+            "path": os.path.abspath(file_path),
+            "exists": mode is not None,
+            "is_file": mode is not None and stat.S_ISREG(mode),
+            "is_dir": mode is not None and stat.S_ISDIR(mode)
         }
     
     async def _get_file_info(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get detailed file information."""
+        return await asyncio.to_thread(self._get_file_info_sync, params)
+    
+    def _get_file_info_sync(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Get detailed file information (blocking)."""
         path = params.get("path")
         if not path:
             raise ValueError("Path parameter is required")
         
         file_path = Path(path)
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
-        
-        stat = file_path.stat()
+        try:
+            file_stat = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"File not found: {path}") from None
         
         return {
-            "path": str(file_path.absolute()),
+            "path": os.path.abspath(file_path),
             "name": file_path.name,
-            "size": stat.st_size,
-            "is_file": file_path.is_file(),
-            "is_dir": file_path.is_dir(),
-            "created": stat.st_ctime,
-            "modified": stat.st_mtime,
-            "permissions": oct(stat.st_mode)[-3:]
-        } 
\ No newline at end of file
+            "size": file_stat.st_size,
+            "is_file": stat.S_ISREG(file_stat.st_mode),
+            "is_dir": stat.S_ISDIR(file_stat.st_mode),
+            "created": file_stat.st_ctime,
+            "modified": file_stat.st_mtime,
+            "permissions": oct(file_stat.st_mode)[-3:]
+        }
+
+
+# Static schema shared by all instances
+_FILESYSTEM_SCHEMA = MCPServerSchema.model_construct(
+    name="FilesystemServer",
+    description=FilesystemServer.description,
+    version=FilesystemServer.version,
+    capabilities={
+        "methods": [
+            "read_file",
+            "write_file", 
+            "list_directory",
+            "file_exists",
+            "get_file_info"
+        ],
+        "resources": [
+            {
+                "uri": "file://",
+                "name": "filesystem",
+                "description": "Local filesystem access"
+            }
+        ]
+    },
+    resources=[
+        {
+            "uri": "file://",
+            "name": "filesystem",
+            "description": "Local filesystem access"
+        }
+    ]
+)
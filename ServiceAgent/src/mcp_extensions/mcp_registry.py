@@ -3,6 +3,7 @@ MCP registry for managing MCP server extensions.
 """
 import importlib
 import inspect
+import pkgutil
 from typing import Dict, List, Type, Any
 from pathlib import Path
 import logging
@@ -16,6 +17,8 @@ class MCPRegistry:
     def __init__(self):
         self.servers: Dict[str, Type[BaseMCPServer]] = {}
         self.server_instances: Dict[str, BaseMCPServer] = {}
+        self._enabled_servers: Dict[str, BaseMCPServer] = {}
+        self._schema_cache: Dict[str, Dict[str, Any]] = {}
         self.logger = logging.getLogger(__name__)
     
     def register_server(self, server_class: Type[BaseMCPServer]) -> None:
@@ -35,6 +38,12 @@ class MCPRegistry:
         server_class = self.servers[server_name]
         instance = server_class(config)
         self.server_instances[server_name] = instance
+        if instance.is_enabled():
+            self._enabled_servers[server_name] = instance
+        else:
+            self._enabled_servers.pop(server_name, None)
+        # Schemas are static per instance, so dump them once
+        self._schema_cache[server_name] = instance.get_schema().model_dump()
         return instance
     
     def get_server(self, server_name: str) -> BaseMCPServer:
@@ -49,10 +58,7 @@ class MCPRegistry:
     
     def get_enabled_servers(self) -> Dict[str, BaseMCPServer]:
         """Get all enabled MCP server instances."""
-        return {
-            name: server for name, server in self.server_instances.items()
-            if server.is_enabled()
-        }
+        return self._enabled_servers.copy()
     
     def load_servers_from_directory(self, directory: str, config_manager) -> None:
         """Load MCP servers from a directory."""
@@ -61,21 +67,21 @@ class MCPRegistry:
             self.logger.warning(f"MCP servers directory does not exist: {directory}")
             return
         
-        # Find all Python files in the directory
-        for py_file in servers_dir.glob("*.py"):
-            if py_file.name.startswith("__") or py_file.name.startswith("base_"):
+        # Find all Python modules in the directory
+        for _, module_stem, is_pkg in pkgutil.iter_modules([str(servers_dir)]):
+            if is_pkg or module_stem.startswith("__") or module_stem.startswith("base_"):
                 continue
             
             try:
                 # Import the module
-                module_name = f"src.mcp_extensions.{py_file.stem}"
+                module_name = f"src.mcp_extensions.{module_stem}"
                 module = importlib.import_module(module_name)
                 
-                # Find server classes in the module
-                for name, obj in inspect.getmembers(module):
+                # Find server classes defined in the module (imported names are skipped)
+                for name, obj in vars(module).items():
                     if (inspect.isclass(obj) and 
-                        issubclass(obj, BaseMCPServer) and 
-                        obj != BaseMCPServer):
+                        obj.__module__ == module_name and
+                        issubclass(obj, BaseMCPServer)):
                         
                         # Check if server is enabled in config
                         server_config = config_manager.get_mcp_config(name)
@@ -87,44 +93,49 @@ class MCPRegistry:
                             self.logger.info(f"MCP server {name} is disabled in configuration")
                 
             except Exception as e:
-                self.logger.error(f"Failed to load MCP server from {py_file}: {e}")
+                self.logger.error(f"Failed to load MCP server from {module_stem}: {e}")
+    
+    async def _initialize_server(self, name: str, server: BaseMCPServer) -> bool:
+        """Initialize a single MCP server, logging the outcome."""
+        try:
+            success = await server.initialize()
+            if success:
+                self.logger.info(f"MCP server {name} initialized successfully")
+            else:
+                self.logger.error(f"Failed to initialize MCP server {name}")
+            return success
+        except Exception as e:
+            self.logger.error(f"Error initializing MCP server {name}: {e}")
+            return False
+    
+    async def _cleanup_server(self, name: str, server: BaseMCPServer) -> bool:
+        """Cleanup a single MCP server, logging the outcome."""
+        try:
+            success = await server.cleanup()
+            if success:
+                self.logger.info(f"MCP server {name} cleaned up successfully")
+            else:
+                self.logger.error(f"Failed to cleanup MCP server {name}")
+            return success
+        except Exception as e:
+            self.logger.error(f"Error cleaning up MCP server {name}: {e}")
+            return False
     
     async def initialize_all_servers(self) -> Dict[str, bool]:
-        """Initialize all enabled MCP servers."""
-        results = {}
+        """Initialize all enabled MCP servers concurrently."""
         enabled_servers = self.get_enabled_servers()
-        
-        for name, server in enabled_servers.items():
-            try:
-                success = await server.initialize()
-                results[name] = success
-                if success:
-                    self.logger.info(f"MCP server {name} initialized successfully")
-                else:
-                    self.logger.error(f"Failed to initialize MCP server {name}")
-            except Exception as e:
-                self.logger.error(f"Error initializing MCP server {name}: {e}")
-                results[name] = False
-        
-        return results
+        results = await asyncio.gather(
+            *(self._initialize_server(name, server) for name, server in enabled_servers.items())
+        )
+        return dict(zip(enabled_servers, results))
     
     async def cleanup_all_servers(self) -> Dict[str, bool]:
-        """Cleanup all MCP servers."""
-        results = {}
-        
-        for name, server in self.server_instances.items():
-            try:
-                success = await server.cleanup()
-                results[name] = success
-                if success:
-                    self.logger.info(f"MCP server {name} cleaned up successfully")
-                else:
-                    self.logger.error(f"Failed to cleanup MCP server {name}")
-            except Exception as e:
-                self.logger.error(f"Error cleaning up MCP server {name}: {e}")
-                results[name] = False
-        
-        return results
+        """Cleanup all MCP servers concurrently."""
+        servers = self.get_all_servers()
+        results = await asyncio.gather(
+            *(self._cleanup_server(name, server) for name, server in servers.items())
+        )
+        return dict(zip(servers, results))
     
     async def handle_request(self, server_name: str, request: MCPRequest) -> MCPResponse:
         """Handle an MCP request for a specific server."""
@@ -133,10 +144,7 @@ class MCPRegistry:
     
     def get_server_schemas(self) -> Dict[str, Any]:
         """Get schemas for all registered MCP servers."""
-        return {
-            name: server.get_schema().dict() 
-            for name, server in self.server_instances.items()
-        }
+        return self._schema_cache.copy()
     
     def list_servers(self) -> List[str]:
         """List all registered MCP server names."""
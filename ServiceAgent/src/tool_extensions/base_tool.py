@@ -1,12 +1,12 @@
 """
 Base tool class for all tool extensions.
 """
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
 import logging
 import time
-from datetime import datetime
 
 
 class ToolSchema(BaseModel):
@@ -19,7 +19,11 @@ class ToolSchema(BaseModel):
 
 
 class ToolResult(BaseModel):
-    """Result from tool execution."""
+    """Result from tool execution.
+    
+    Results built by tool code from trusted internal data use model_construct
+    to skip validation; validate only data that crosses an external boundary.
+    """
     success: bool
     result: Any
     error: Optional[str] = None
@@ -30,9 +34,16 @@ class ToolResult(BaseModel):
 class BaseTool(ABC):
     """Base class for all tool extensions."""
     
+    logger = logging.getLogger(__name__)
+    
+    def __init_subclass__(cls, **kwargs):
+        """Resolve one logger per subclass at class creation."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(f"{__name__}.{cls.__name__}")
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._enabled = bool(config.get("enabled", False))
         self.name = self.__class__.__name__
         self.description = getattr(self, 'description', 'No description provided')
         self.schema = self._create_schema()
@@ -57,7 +68,7 @@ class BaseTool(ABC):
     
     def execute_with_timing(self, **kwargs) -> ToolResult:
         """Execute tool with timing information."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Validate input
@@ -67,30 +78,35 @@ class BaseTool(ABC):
             result = self.execute(**kwargs)
             
             # Add timing information
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             result.execution_time = execution_time
             
             self.logger.info(f"Tool {self.name} executed successfully in {execution_time:.2f}s")
             return result
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             self.logger.error(f"Tool {self.name} failed: {str(e)}")
             
-            return ToolResult(
+            return ToolResult.model_construct(
                 success=False,
                 result=None,
                 error=str(e),
-                execution_time=execution_time
+                execution_time=execution_time,
+                metadata={}
             )
     
+    async def aexecute(self, **kwargs) -> ToolResult:
+        """Execute tool with timing on a worker thread, keeping the event loop free."""
+        return await asyncio.to_thread(self.execute_with_timing, **kwargs)
+    
     def get_schema(self) -> ToolSchema:
         """Get the tool schema."""
         return self.schema
     
     def is_enabled(self) -> bool:
         """Check if the tool is enabled based on configuration."""
-        return self.config.get("enabled", False)
+        return self._enabled
     
     def get_config(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
@@ -2,45 +2,68 @@
 Calculator tool extension.
 """
 import ast
-import operator
+from functools import lru_cache
 from typing import Dict, Any
 from .base_tool import BaseTool, ToolSchema, ToolResult
 
 
+# Allowed arithmetic operators
+_ALLOWED_OPERATORS = frozenset({ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd})
+
+
+def _validate_constant(node: ast.Constant) -> None:
+    if isinstance(node.value, bool) or not isinstance(node.value, (int, float, complex)):
+        raise ValueError(f"Unsupported constant: {node.value!r}")
+
+
+def _validate_bin_op(node: ast.BinOp) -> None:
+    if type(node.op) not in _ALLOWED_OPERATORS:
+        raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+    _validate_node(node.left)
+    _validate_node(node.right)
+
+
+def _validate_unary_op(node: ast.UnaryOp) -> None:
+    if type(node.op) not in _ALLOWED_OPERATORS:
+        raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+    _validate_node(node.operand)
+
+
+# Validator per allowed expression node type
+_NODE_VALIDATORS = {
+    ast.Constant: _validate_constant,
+    ast.BinOp: _validate_bin_op,
+    ast.UnaryOp: _validate_unary_op
+}
+
+
+def _validate_node(node: ast.AST) -> None:
+    """Ensure an expression node only uses numeric literals and allowed operators."""
+    validator = _NODE_VALIDATORS.get(type(node))
+    if validator is None:
+        raise ValueError(f"Unsupported operation: {type(node).__name__}")
+    validator(node)
+
+
+@lru_cache(maxsize=1024)
+def _evaluate_expression(expression: str) -> Any:
+    """Parse, validate and evaluate an expression; repeated expressions hit the cache.
+    
+    Validated expressions contain only numeric literals, so the result is fully
+    determined by the text and CPython constant-folds it while compiling.
+    """
+    tree = ast.parse(expression, mode='eval')
+    _validate_node(tree.body)
+    return eval(compile(tree, '<expr>', 'eval'), {"__builtins__": {}}, {})
+
+
 class Calculator(BaseTool):
     """Simple calculator tool for mathematical operations."""
     
     description = "Performs mathematical calculations on expressions"
     
     def _create_schema(self) -> ToolSchema:
-        return ToolSchema(
-            name="Calculator",
-            description=self.description,
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "expression": {
-                        "type": "string",
-                        "description": "Mathematical expression to evaluate"
-                    }
-                },
-                "required": ["expression"]
-            },
-            output_schema={
-                "type": "object",
-                "properties": {
-                    "result": {
-                        "type": "number",
-                        "description": "Result of the calculation"
-                    },
-                    "expression": {
-                        "type": "string",
-                        "description": "Original expression"
-                    }
-                }
-            },
-            required_params=["expression"]
-        )
+        return _CALCULATOR_SCHEMA
     
     def execute(self, **kwargs) -> ToolResult:
         expression = kwargs["expression"]
@@ -49,7 +72,7 @@ class Calculator(BaseTool):
             # Safely evaluate the expression
             result = self._safe_eval(expression)
             
-            return ToolResult(
+            return ToolResult.model_construct(
                 success=True,
                 result={
                     "result": result,
@@ -58,7 +81,7 @@ class Calculator(BaseTool):
             )
             
         except Exception as e:
-            return ToolResult(
+            return ToolResult.model_construct(
                 success=False,
                 result=None,
                 error=f"Calculation failed: {str(e)}"
@@ -66,27 +89,34 @@ class Calculator(BaseTool):
     
     def _safe_eval(self, expression: str) -> float:
         """Safely evaluate a mathematical expression."""
-        # Define allowed operators
-        allowed_operators = {
-            ast.Add: operator.add,
-            ast.Sub: operator.sub,
-            ast.Mult: operator.mul,
-            ast.Div: operator.truediv,
-            ast.Pow: operator.pow,
-            ast.USub: operator.neg,
-            ast.UAdd: operator.pos
+        return _evaluate_expression(expression)
+
+# Static schema shared by all instances
+_CALCULATOR_SCHEMA = ToolSchema.model_construct(
+    name="Calculator",
+    description=Calculator.description,
+    input_schema={
+        "type": "object",
+        "properties": {
+            "expression": {
+                "type": "string",
+                "description": "Mathematical expression to evaluate"
+            }
+        },
+        "required": ["expression"]
+    },
+    output_schema={
+        "type": "object",
+        "properties": {
+            "result": {
+                "type": "number",
+                "description": "Result of the calculation"
+            },
+            "expression": {
+                "type": "string",
+                "description": "Original expression"
+            }
         }
-        
-        def eval_node(node):
-            if isinstance(node, ast.Num):
-                return node.n
-            elif isinstance(node, ast.BinOp):
-                return allowed_operators[type(node.op)](eval_node(node.left), eval_node(node.right))
-            elif isinstance(node, ast.UnaryOp):
-                return allowed_operators[type(node.op)](eval_node(node.operand))
-            else:
-                raise ValueError(f"Unsupported operation: {type(node).__name__}")
-        
-        # Parse and evaluate
-        tree = ast.parse(expression, mode='eval')
-        return eval_node(tree.body) 
\ No newline at end of file
+    },
+    required_params=["expression"]
+)
@@ -1,50 +1,45 @@
 """
 File operations tool extension.
 """
+import mmap
 import os
-from pathlib import Path
-from typing import Dict, Any, List
+import stat
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple
 from .base_tool import BaseTool, ToolSchema, ToolResult
 
 
+# Buffer size for file writes
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Maximum number of cached directory listings
+_LIST_CACHE_MAX_ENTRIES = 1000
+
+
 class FileOperations(BaseTool):
     """File operations tool for reading and writing files."""
     
     description = "Performs file operations like reading, writing, and listing files"
     
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        # Directory listings by absolute path: (cached_at, dir mtime_ns, result).
+        # Entries added/removed invalidate via mtime and our own writes drop the entry;
+        # sizes changed by other writers may be up to ttl seconds stale.
+        self._list_cache: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+        self._list_cache_ttl = config.get("list_cache_ttl", 60)
+        # Tools run on worker threads (see BaseTool.aexecute); guards _list_cache
+        self._list_cache_lock = threading.Lock()
+        # Limits resolved once from config
+        allowed = config.get("allowed_extensions")
+        self._allowed_ext = frozenset(ext.lower() for ext in allowed) if allowed else None
+        self._max_size_mb = config.get("max_file_size_mb", 10)
+        self._max_size_bytes = self._max_size_mb * 1024 * 1024
+    
     def _create_schema(self) -> ToolSchema:
-        return ToolSchema(
-            name="FileOperations",
-            description=self.description,
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "operation": {
-                        "type": "string",
-                        "enum": ["read", "write", "list", "exists"],
-                        "description": "File operation to perform"
-                    },
-                    "path": {
-                        "type": "string",
-                        "description": "File or directory path"
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "Content to write (for write operation)"
-                    }
-                },
-                "required": ["operation", "path"]
-            },
-            output_schema={
-                "type": "object",
-                "properties": {
-                    "success": {"type": "boolean"},
-                    "result": {"type": "object"},
-                    "error": {"type": "string"}
-                }
-            },
-            required_params=["operation", "path"]
-        )
+        return _FILE_OPERATIONS_SCHEMA
     
     def execute(self, **kwargs) -> ToolResult:
         operation = kwargs["operation"]
@@ -68,13 +63,13 @@ class FileOperations(BaseTool):
             else:
                 raise ValueError(f"Unsupported operation: {operation}")
             
-            return ToolResult(
+            return ToolResult.model_construct(
                 success=True,
                 result=result
             )
             
         except Exception as e:
-            return ToolResult(
+            return ToolResult.model_construct(
                 success=False,
                 result=None,
                 error=str(e)
@@ -82,86 +77,170 @@ class FileOperations(BaseTool):
     
     def _validate_file_extension(self, path: str) -> None:
         """Validate file extension against allowed extensions."""
-        allowed_extensions = self.config.get("allowed_extensions", [])
-        if allowed_extensions:
-            file_ext = Path(path).suffix.lower()
-            if file_ext not in allowed_extensions:
-                raise ValueError(f"File extension {file_ext} not allowed. Allowed: {allowed_extensions}")
+        if self._allowed_ext is not None:
+            file_ext = os.path.splitext(path)[1].lower()
+            if file_ext not in self._allowed_ext:
+                raise ValueError(f"File extension {file_ext} not allowed. Allowed: {self.config['allowed_extensions']}")
     
     def _read_file(self, path: str) -> Dict[str, Any]:
         """Read file content."""
-        file_path = Path(path)
+        file_path = os.path.abspath(path)
         
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
+        # One stat() covers existence, type and size
+        try:
+            file_stat = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"File not found: {path}") from None
         
-        if not file_path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             raise ValueError(f"Path is not a file: {path}")
         
         # Check file size limit
-        max_size_mb = self.config.get("max_file_size_mb", 10)
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
+        size = file_stat.st_size
+        if size > self._max_size_bytes:
+            raise ValueError(f"File too large: {size / (1024 * 1024):.2f}MB > {self._max_size_mb}MB")
         
-        if file_size_mb > max_size_mb:
-            raise ValueError(f"File too large: {file_size_mb:.2f}MB > {max_size_mb}MB")
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = self._read_mapped(file_path, size) if size else ""
         
         return {
             "content": content,
-            "size_bytes": file_path.stat().st_size,
-            "path": str(file_path.absolute())
+            "size_bytes": size,
+            "path": file_path
         }
     
+    def _read_mapped(self, file_path: str, size: int) -> str:
+        """Decode a file straight from a read-only memory map."""
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            # Start readahead for the whole file before the first page fault
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+            with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                content = str(mm, "utf-8")
+        finally:
+            os.close(fd)
+        
+        # Match text-mode reads, which translate newlines
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+    
     def _write_file(self, path: str, content: str) -> Dict[str, Any]:
         """Write content to file."""
-        file_path = Path(path)
+        file_path = os.path.abspath(path)
         
         # Create directory if it doesn't exist
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Encode once; the same bytes are written and measured
+        data = content.encode('utf-8')
+        with open(file_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(data)
+        
+        # Overwrites leave the directory mtime unchanged; drop its cached listing
+        with self._list_cache_lock:
+            self._list_cache.pop(os.path.dirname(file_path), None)
         
         return {
-            "path": str(file_path.absolute()),
-            "size_bytes": len(content.encode('utf-8')),
+            "path": file_path,
+            "size_bytes": len(data),
             "written": True
         }
     
     def _list_directory(self, path: str) -> Dict[str, Any]:
         """List directory contents."""
-        dir_path = Path(path)
+        dir_path = os.path.abspath(path)
         
-        if not dir_path.exists():
-            raise FileNotFoundError(f"Directory not found: {path}")
+        try:
+            dir_stat = os.stat(dir_path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"Directory not found: {path}") from None
         
-        if not dir_path.is_dir():
+        if not stat.S_ISDIR(dir_stat.st_mode):
             raise ValueError(f"Path is not a directory: {path}")
         
+        # Serve a cached listing while it is fresh and the directory is unchanged
+        now = time.monotonic()
+        with self._list_cache_lock:
+            cached = self._list_cache.get(dir_path)
+            if cached and now - cached[0] < self._list_cache_ttl and cached[1] == dir_stat.st_mtime_ns:
+                self._list_cache.move_to_end(dir_path)
+                return cached[2]
+        
+        # DirEntry type checks use the cached directory listing; only files need a stat
         items = []
-        for item in dir_path.iterdir():
-            item_info = {
-                "name": item.name,
-                "type": "directory" if item.is_dir() else "file",
-                "size_bytes": item.stat().st_size if item.is_file() else None
-            }
-            items.append(item_info)
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                items.append({
+                    "name": entry.name,
+                    "type": "directory" if entry.is_dir() else "file",
+                    "size_bytes": entry.stat().st_size if entry.is_file() else None
+                })
         
-        return {
-            "path": str(dir_path.absolute()),
+        result = {
+            "path": dir_path,
             "items": items,
             "total_items": len(items)
         }
+        
+        with self._list_cache_lock:
+            self._list_cache[dir_path] = (now, dir_stat.st_mtime_ns, result)
+            self._list_cache.move_to_end(dir_path)
+            if len(self._list_cache) > _LIST_CACHE_MAX_ENTRIES:
+                self._list_cache.popitem(last=False)
+        
+        return result
     
     def _file_exists(self, path: str) -> Dict[str, Any]:
         """Check if file or directory exists."""
-        path_obj = Path(path)
+        abs_path = os.path.abspath(path)
+        
+        # One stat() answers all three questions
+        try:
+            mode = os.stat(abs_path).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            mode = None
         
         return {
-            "path": str(path_obj.absolute()),
-            "exists": path_obj.exists(),
-            "is_file": path_obj.is_file() if path_obj.exists() else False,
-            "is_dir": path_obj.is_dir() if path_obj.exists() else False
-        } 
\ No newline at end of file
+            "path": abs_path,
+            "exists": mode is not None,
+            "is_file": mode is not None and stat.S_ISREG(mode),
+            "is_dir": mode is not None and stat.S_ISDIR(mode)
+        }
+
+
+# Static schema shared by all instances
+_FILE_OPERATIONS_SCHEMA = ToolSchema.model_construct(
+    name="FileOperations",
+    description=FileOperations.description,
+    input_schema={
+        "type": "object",
+        "properties": {
+            "operation": {
+                "type": "string",
+                "enum": ["read", "write", "list", "exists"],
+                "description": "File operation to perform"
+            },
+            "path": {
+                "type": "string",
+                "description": "File or directory path"
+            },
+            "content": {
+                "type": "string",
+                "description": "Content to write (for write operation)"
+            }
+        },
+        "required": ["operation", "path"]
+    },
+    output_schema={
+        "type": "object",
+        "properties": {
+            "success": {"type": "boolean"},
+            "result": {"type": "object"},
+            "error": {"type": "string"}
+        }
+    },
+    required_params=["operation", "path"]
+)
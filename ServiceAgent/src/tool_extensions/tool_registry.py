@@ -3,7 +3,9 @@ Tool registry for managing tool extensions.
 """
 import importlib
 import inspect
-from typing import Dict, List, Type, Any
+import pkgutil
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Type, Any
 from pathlib import Path
 import logging
 from .base_tool import BaseTool
@@ -15,6 +17,8 @@ class ToolRegistry:
     def __init__(self):
         self.tools: Dict[str, Type[BaseTool]] = {}
         self.tool_instances: Dict[str, BaseTool] = {}
+        self._enabled_tools: Dict[str, BaseTool] = {}
+        self._schema_cache: Dict[str, Dict[str, Any]] = {}
         self.logger = logging.getLogger(__name__)
     
     def register_tool(self, tool_class: Type[BaseTool]) -> None:
@@ -34,6 +38,12 @@ class ToolRegistry:
         tool_class = self.tools[tool_name]
         instance = tool_class(config)
         self.tool_instances[tool_name] = instance
+        if instance.is_enabled():
+            self._enabled_tools[tool_name] = instance
+        else:
+            self._enabled_tools.pop(tool_name, None)
+        # Schemas are static per instance, so dump them once
+        self._schema_cache[tool_name] = instance.get_schema().model_dump()
         return instance
     
     def get_tool(self, tool_name: str) -> BaseTool:
@@ -46,12 +56,9 @@ class ToolRegistry:
         """Get all registered tool instances."""
         return self.tool_instances.copy()
     
-    def get_enabled_tools(self) -> Dict[str, BaseTool]:
-        """Get all enabled tool instances."""
-        return {
-            name: tool for name, tool in self.tool_instances.items()
-            if tool.is_enabled()
-        }
+    def get_enabled_tools(self) -> Mapping[str, BaseTool]:
+        """Get a read-only view of enabled tool instances."""
+        return MappingProxyType(self._enabled_tools)
     
     def load_tools_from_directory(self, directory: str, config_manager) -> None:
         """Load tools from a directory."""
@@ -60,21 +67,21 @@ class ToolRegistry:
             self.logger.warning(f"Tools directory does not exist: {directory}")
             return
         
-        # Find all Python files in the directory
-        for py_file in tools_dir.glob("*.py"):
-            if py_file.name.startswith("__") or py_file.name.startswith("base_"):
+        # Find all Python modules in the directory
+        for _, module_stem, is_pkg in pkgutil.iter_modules([str(tools_dir)]):
+            if is_pkg or module_stem.startswith("__") or module_stem.startswith("base_"):
                 continue
             
             try:
                 # Import the module
-                module_name = f"src.tool_extensions.{py_file.stem}"
+                module_name = f"src.tool_extensions.{module_stem}"
                 module = importlib.import_module(module_name)
                 
-                # Find tool classes in the module
-                for name, obj in inspect.getmembers(module):
+                # Find tool classes defined in the module (imported names are skipped)
+                for name, obj in vars(module).items():
                     if (inspect.isclass(obj) and 
-                        issubclass(obj, BaseTool) and 
-                        obj != BaseTool):
+                        obj.__module__ == module_name and
+                        issubclass(obj, BaseTool)):
                         
                         # Check if tool is enabled in config
                         tool_config = config_manager.get_tool_config(name)
@@ -86,19 +93,21 @@ class ToolRegistry:
                             self.logger.info(f"Tool {name} is disabled in configuration")
                 
             except Exception as e:
-                self.logger.error(f"Failed to load tool from {py_file}: {e}")
+                self.logger.error(f"Failed to load tool from {module_stem}: {e}")
     
     def execute_tool(self, tool_name: str, **kwargs) -> Any:
         """Execute a tool by name."""
         tool = self.get_tool(tool_name)
         return tool.execute_with_timing(**kwargs)
     
+    async def aexecute_tool(self, tool_name: str, **kwargs) -> Any:
+        """Execute a tool by name without blocking the event loop."""
+        tool = self.get_tool(tool_name)
+        return await tool.aexecute(**kwargs)
+    
     def get_tool_schemas(self) -> Dict[str, Any]:
         """Get schemas for all registered tools."""
-        return {
-            name: tool.get_schema().dict() 
-            for name, tool in self.tool_instances.items()
-        }
+        return self._schema_cache.copy()
     
     def list_tools(self) -> List[str]:
         """List all registered tool names."""
@@ -106,7 +115,7 @@ class ToolRegistry:
     
     def list_enabled_tools(self) -> List[str]:
         """List all enabled tool names."""
-        return list(self.get_enabled_tools().keys())
+        return list(self._enabled_tools)
 
 
 # Global tool registry instance
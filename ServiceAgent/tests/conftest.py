@@ -0,0 +1,9 @@
+"""
+Shared pytest configuration for the ServiceAgent tests.
+"""
+
+import sys
+from pathlib import Path
+
+# Make the ``src`` package importable whether pytest runs from here or the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,58 @@
+"""
+Tests for the FileOperations tool.
+"""
+
+import os
+
+import pytest
+
+from src.tool_extensions.file_operations import FileOperations
+
+
+@pytest.fixture
+def file_ops():
+    """Create a file operations tool with listing cache enabled."""
+    return FileOperations({
+        "enabled": True,
+        "allowed_extensions": [".txt"],
+        "max_file_size_mb": 1,
+        "list_cache_ttl": 60
+    })
+
+
+def test_list_after_overwrite_reports_new_size(file_ops, tmp_path):
+    """Overwriting a file through the tool is visible in the next listing."""
+    target = tmp_path / "notes.txt"
+    
+    assert file_ops.execute(operation="write", path=str(target), content="abc").success
+    first = file_ops.execute(operation="list", path=str(tmp_path))
+    assert first.result["items"][0]["size_bytes"] == 3
+    
+    # Same directory entries, so the directory mtime does not change
+    assert file_ops.execute(operation="write", path=str(target), content="abcdefgh").success
+    second = file_ops.execute(operation="list", path=str(tmp_path))
+    assert second.result["items"][0]["size_bytes"] == 8
+
+
+def test_list_is_served_from_cache(file_ops, tmp_path):
+    """An unchanged directory is listed from the cache."""
+    (tmp_path / "a.txt").write_text("a")
+    
+    first = file_ops.execute(operation="list", path=str(tmp_path))
+    second = file_ops.execute(operation="list", path=str(tmp_path))
+    assert second.result is first.result
+
+
+def test_list_after_external_change_is_refreshed(file_ops, tmp_path):
+    """A file added outside the tool changes the directory mtime and refreshes the listing."""
+    (tmp_path / "a.txt").write_text("a")
+    first = file_ops.execute(operation="list", path=str(tmp_path))
+    assert [item["name"] for item in first.result["items"]] == ["a.txt"]
+    
+    (tmp_path / "b.txt").write_text("b")
+    # Push the mtime forward in case the filesystem timestamp granularity hides the change
+    stat = tmp_path.stat()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    second = file_ops.execute(operation="list", path=str(tmp_path))
+    assert sorted(item["name"] for item in second.result["items"]) == ["a.txt", "b.txt"]
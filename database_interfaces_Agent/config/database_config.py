@@ -3,8 +3,10 @@ Database-specific configuration and connection parameters.
 """
 
 from enum import Enum
+from functools import cached_property
 from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field
+from urllib.parse import urlencode
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DatabaseType(str, Enum):
@@ -19,6 +21,9 @@ class DatabaseType(str, Enum):
 class DatabaseConnectionConfig(BaseModel):
     """Database connection configuration."""
     
+    # Frozen: a validated config is never mutated, only replaced
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     database_type: DatabaseType
     host: str
     port: int
@@ -29,8 +34,30 @@ class DatabaseConnectionConfig(BaseModel):
     connection_timeout: Optional[int] = None
     max_connections: Optional[int] = None
     
-    class Config:
-        extra = "forbid"  # Prevent additional fields
+    @cached_property
+    def mcp_arguments(self) -> Dict[str, Any]:
+        """Credential arguments shared by the MCP database tools.
+        
+        Built once per (frozen) config; callers must copy before adding keys.
+        """
+        return {
+            "host": self.host,
+            "port": self.port,
+            "username": self.username,
+            "password": self.password,
+            "database_name": self.database_name
+        }
+    
+    @cached_property
+    def summary(self) -> Dict[str, Any]:
+        """Non-sensitive description of the connection, built once per config."""
+        return {
+            "database_type": self.database_type.value,
+            "host": self.host,
+            "port": self.port,
+            "database_name": self.database_name,
+            "ssl_mode": self.ssl_mode
+        }
 
 
 class DatabaseDefaults:
@@ -60,60 +87,41 @@ class DatabaseDefaults:
         return defaults_map.get(database_type, {})
 
 
+# Connection URL templates and query parameter names per database type
+_POSTGRESQL_URL = "postgresql://{c.username}:{c.password}@{c.host}:{c.port}"
+_POSTGRESQL_PARAMS = ("sslmode", "connect_timeout", "max_connections")
+_MYSQL_URL = "mysql://{c.username}:{c.password}@{c.host}:{c.port}"
+_MYSQL_PARAMS = ("ssl_mode", "connection_timeout", "max_connections")
+
+# Accepted SSL modes per database type
+_POSTGRESQL_SSL_MODES = frozenset({"disable", "allow", "prefer", "require", "verify-ca", "verify-full"})
+_MYSQL_SSL_MODES = frozenset({"disabled", "preferred", "required", "verify_ca", "verify_identity"})
+
+
 class ConnectionStringBuilder:
     """Build database connection strings."""
     
     @staticmethod
-    def build_postgresql_connection_string(config: DatabaseConnectionConfig) -> str:
-        """Build PostgreSQL connection string."""
-        params = []
-        
-        if config.ssl_mode:
-            params.append(f"sslmode={config.ssl_mode}")
-        
-        if config.connection_timeout:
-            params.append(f"connect_timeout={config.connection_timeout}")
-        
-        if config.max_connections:
-            params.append(f"max_connections={config.max_connections}")
-        
-        param_string = "&".join(params) if params else ""
-        
+    def _build_url(template: str, param_names: tuple, config: DatabaseConnectionConfig) -> str:
+        """Fill a URL template and append the set query parameters."""
+        base_url = template.format(c=config)
         if config.database_name:
-            base_url = f"postgresql://{config.username}:{config.password}@{config.host}:{config.port}/{config.database_name}"
-        else:
-            base_url = f"postgresql://{config.username}:{config.password}@{config.host}:{config.port}"
+            base_url = f"{base_url}/{config.database_name}"
         
-        if param_string:
-            return f"{base_url}?{param_string}"
+        values = (config.ssl_mode, config.connection_timeout, config.max_connections)
+        query = urlencode({name: value for name, value in zip(param_names, values) if value})
         
-        return base_url
+        return f"{base_url}?{query}" if query else base_url
     
-    @staticmethod
-    def build_mysql_connection_string(config: DatabaseConnectionConfig) -> str:
+    @classmethod
+    def build_postgresql_connection_string(cls, config: DatabaseConnectionConfig) -> str:
+        """Build PostgreSQL connection string."""
+        return cls._build_url(_POSTGRESQL_URL, _POSTGRESQL_PARAMS, config)
+    
+    @classmethod
+    def build_mysql_connection_string(cls, config: DatabaseConnectionConfig) -> str:
         """Build MySQL connection string."""
-        params = []
-        
-        if config.ssl_mode:
-            params.append(f"ssl_mode={config.ssl_mode}")
-        
-        if config.connection_timeout:
-            params.append(f"connection_timeout={config.connection_timeout}")
-        
-        if config.max_connections:
-            params.append(f"max_connections={config.max_connections}")
-        
-        param_string = "&".join(params) if params else ""
-        
-        if config.database_name:
-            base_url = f"mysql://{config.username}:{config.password}@{config.host}:{config.port}/{config.database_name}"
-        else:
-            base_url = f"mysql://{config.username}:{config.password}@{config.host}:{config.port}"
-        
-        if param_string:
-            return f"{base_url}?{param_string}"
-        
-        return base_url
+        return cls._build_url(_MYSQL_URL, _MYSQL_PARAMS, config)
     
     @classmethod
     def build_connection_string(cls, config: DatabaseConnectionConfig) -> str:
@@ -139,7 +147,7 @@ class DatabaseValidationRules:
         if not (1024 <= config.port <= 65535):
             raise ValueError("PostgreSQL port must be between 1024 and 65535")
         
-        if config.ssl_mode and config.ssl_mode not in ["disable", "allow", "prefer", "require", "verify-ca", "verify-full"]:
+        if config.ssl_mode and config.ssl_mode not in _POSTGRESQL_SSL_MODES:
             raise ValueError("Invalid SSL mode for PostgreSQL")
     
     @staticmethod
@@ -148,7 +156,7 @@ class DatabaseValidationRules:
         if not (1024 <= config.port <= 65535):
             raise ValueError("MySQL port must be between 1024 and 65535")
         
-        if config.ssl_mode and config.ssl_mode not in ["disabled", "preferred", "required", "verify_ca", "verify_identity"]:
+        if config.ssl_mode and config.ssl_mode not in _MYSQL_SSL_MODES:
             raise ValueError("Invalid SSL mode for MySQL")
     
     @classmethod
@@ -4,6 +4,7 @@ Uses Pydantic settings for environment variable management.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -33,6 +34,9 @@ class Settings(BaseSettings):
     mcp_timeout: int = Field(default=30, env="MCP_TIMEOUT")
     mcp_retry_attempts: int = Field(default=3, env="MCP_RETRY_ATTEMPTS")
     
+    # Workflow settings
+    persist_checkpoints: bool = Field(default=False, env="PERSIST_CHECKPOINTS")
+    
     # Database connection settings
     default_postgres_port: int = Field(default=5432, env="DEFAULT_POSTGRES_PORT")
     default_mysql_port: int = Field(default=3306, env="DEFAULT_MYSQL_PORT")
@@ -42,6 +46,7 @@ class Settings(BaseSettings):
     redis_port: int = Field(default=6379, env="REDIS_PORT")
     redis_db: int = Field(default=0, env="REDIS_DB")
     redis_password: Optional[str] = Field(default=None, env="REDIS_PASSWORD")
+    redis_pool_size: int = Field(default=50, env="REDIS_POOL_SIZE")
     
     # API settings
     api_host: str = Field(default="0.0.0.0", env="API_HOST")
@@ -58,17 +63,20 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-# Global settings instance
-settings = Settings()
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the global settings instance."""
-    return settings
+    """Get the global settings instance.
+    
+    Settings are read from the environment and .env on first use only;
+    call get_settings.cache_clear() to force a re-read (e.g. in tests).
+    """
+    return Settings()
 
 
 def validate_settings() -> None:
     """Validate critical settings."""
+    settings = get_settings()
+    
     if not settings.encryption_key or settings.encryption_key.startswith("dev-"):
         print("⚠️  Warning: Using development encryption key. Set ENCRYPTION_KEY in production.")
     
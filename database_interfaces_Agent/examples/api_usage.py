@@ -6,10 +6,10 @@ Demonstrates how to interact with the agent via REST API.
 
 import asyncio
 import aiohttp
-import json
+import orjson
 import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
@@ -21,18 +21,35 @@ async def api_example():
     
     base_url = "http://localhost:8000"
     
-    async with aiohttp.ClientSession() as session:
+    # Keep-alive pool so the calls below reuse connections
+    connector = aiohttp.TCPConnector(
+        limit=0,
+        limit_per_host=32,
+        keepalive_timeout=30,
+        enable_cleanup_closed=True
+    )
+    
+    async with aiohttp.ClientSession(connector=connector) as session:
+        
+        async def request(method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+            # orjson encodes straight to bytes and decodes the raw body
+            kwargs: Dict[str, Any] = {}
+            if payload is not None:
+                kwargs["data"] = orjson.dumps(payload)
+                kwargs["headers"] = {"Content-Type": "application/json"}
+            async with session.request(method, f"{base_url}{path}", **kwargs) as response:
+                return orjson.loads(await response.read())
+        
         try:
             # 1. Create a session
             print("Creating session...")
-            async with session.post(f"{base_url}/sessions") as response:
-                session_data = await response.json()
-                if session_data["success"]:
-                    reference_id = session_data["reference_id"]
-                    print(f"Session created: {reference_id}")
-                else:
-                    print(f"Failed to create session: {session_data['error']}")
-                    return
+            session_data = await request("POST", "/sessions")
+            if session_data["success"]:
+                reference_id = session_data["reference_id"]
+                print(f"Session created: {reference_id}")
+            else:
+                print(f"Failed to create session: {session_data['error']}")
+                return
             
             # 2. Connect to database
             print("Connecting to database...")
@@ -45,46 +62,43 @@ async def api_example():
                 "database_name": "testdb"
             }
             
-            async with session.post(
-                f"{base_url}/sessions/{reference_id}/connect",
-                json=connection_data
-            ) as response:
-                connection_result = await response.json()
-                if connection_result["success"]:
-                    print(f"✓ {connection_result['message']}")
-                else:
-                    print(f"✗ {connection_result['message']}")
-                    if connection_result.get("error"):
-                        print(f"Error: {connection_result['error']}")
-                    return
+            connection_result = await request(
+                "POST", f"/sessions/{reference_id}/connect", payload=connection_data
+            )
+            if connection_result["success"]:
+                print(f"✓ {connection_result['message']}")
+            else:
+                print(f"✗ {connection_result['message']}")
+                if connection_result.get("error"):
+                    print(f"Error: {connection_result['error']}")
+                return
+            
+            # 3 and 4 are independent, so issue them together
+            query_data = {"query": "SELECT version()"}
+            tables_result, query_result = await asyncio.gather(
+                request("GET", f"/sessions/{reference_id}/tables"),
+                request("POST", f"/sessions/{reference_id}/query", payload=query_data)
+            )
             
             # 3. List tables
             print("\nListing tables...")
-            async with session.get(f"{base_url}/sessions/{reference_id}/tables") as response:
-                tables_result = await response.json()
-                if tables_result["success"]:
-                    tables = tables_result.get("tables", [])
-                    print(f"Found {len(tables)} tables")
-                    for table in tables[:5]:  # Show first 5 tables
-                        print(f"  - {table.get('schema', '')}.{table.get('table', '')}")
-                else:
-                    print(f"Failed to list tables: {tables_result['message']}")
+            if tables_result["success"]:
+                tables = tables_result.get("tables", [])
+                print(f"Found {len(tables)} tables")
+                for table in tables[:5]:  # Show first 5 tables
+                    print(f"  - {table.get('schema', '')}.{table.get('table', '')}")
+            else:
+                print(f"Failed to list tables: {tables_result['message']}")
             
             # 4. Execute a query
             print("\nExecuting query...")
-            query_data = {"query": "SELECT version()"}
-            async with session.post(
-                f"{base_url}/sessions/{reference_id}/query",
-                json=query_data
-            ) as response:
-                query_result = await response.json()
-                if query_result["success"]:
-                    data = query_result.get("data", {})
-                    if data.get("type") == "select" and data.get("rows"):
-                        version = data["rows"][0].get("version", "Unknown")
-                        print(f"Database version: {version}")
-                else:
-                    print(f"Query failed: {query_result['message']}")
+            if query_result["success"]:
+                data = query_result.get("data", {})
+                if data.get("type") == "select" and data.get("rows"):
+                    version = data["rows"][0].get("version", "Unknown")
+                    print(f"Database version: {version}")
+            else:
+                print(f"Query failed: {query_result['message']}")
             
             # 5. Get table schema (if tables exist)
             if tables_result["success"] and tables_result.get("tables"):
@@ -93,58 +107,56 @@ async def api_example():
                 if table_name:
                     print(f"\nGetting schema for table: {table_name}")
                     schema_data = {"table_name": table_name}
-                    async with session.post(
-                        f"{base_url}/sessions/{reference_id}/schema",
-                        json=schema_data
-                    ) as response:
-                        schema_result = await response.json()
-                        if schema_result["success"]:
-                            columns = schema_result.get("columns", [])
-                            print(f"Table has {len(columns)} columns")
-                            for col in columns[:3]:  # Show first 3 columns
-                                print(f"  - {col.get('name')}: {col.get('data_type')}")
-                        else:
-                            print(f"Failed to get schema: {schema_result['message']}")
+                    schema_result = await request(
+                        "POST", f"/sessions/{reference_id}/schema", payload=schema_data
+                    )
+                    if schema_result["success"]:
+                        columns = schema_result.get("columns", [])
+                        print(f"Table has {len(columns)} columns")
+                        for col in columns[:3]:  # Show first 3 columns
+                            print(f"  - {col.get('name')}: {col.get('data_type')}")
+                    else:
+                        print(f"Failed to get schema: {schema_result['message']}")
+            
+            # 6, 7 and 8 are independent, so issue them together
+            session_info, sessions_result, health = await asyncio.gather(
+                request("GET", f"/sessions/{reference_id}"),
+                request("GET", "/sessions"),
+                request("GET", "/health")
+            )
             
             # 6. Get session information
             print("\nSession information:")
-            async with session.get(f"{base_url}/sessions/{reference_id}") as response:
-                session_info = await response.json()
-                if session_info["success"]:
-                    session = session_info["session"]
-                    print(f"  Status: {session['agent_status']}")
-                    print(f"  Connection: {session['connection_status']}")
-                    print(f"  Created: {session['created_at']}")
-                    print(f"  TTL: {session['ttl']} seconds")
-                else:
-                    print(f"Failed to get session info: {session_info['message']}")
+            if session_info["success"]:
+                session_details = session_info["session"]
+                print(f"  Status: {session_details['agent_status']}")
+                print(f"  Connection: {session_details['connection_status']}")
+                print(f"  Created: {session_details['created_at']}")
+                print(f"  TTL: {session_details['ttl']} seconds")
+            else:
+                print(f"Failed to get session info: {session_info['message']}")
             
             # 7. List all sessions
             print("\nAll sessions:")
-            async with session.get(f"{base_url}/sessions") as response:
-                sessions_result = await response.json()
-                if sessions_result["success"]:
-                    sessions = sessions_result.get("sessions", [])
-                    print(f"Total sessions: {len(sessions)}")
-                    for sess in sessions[:3]:  # Show first 3 sessions
-                        print(f"  - {sess['reference_id']}: {sess['agent_status']}")
-                else:
-                    print(f"Failed to list sessions: {sessions_result['message']}")
+            if sessions_result["success"]:
+                sessions = sessions_result.get("sessions", [])
+                print(f"Total sessions: {len(sessions)}")
+                for sess in sessions[:3]:  # Show first 3 sessions
+                    print(f"  - {sess['reference_id']}: {sess['agent_status']}")
+            else:
+                print(f"Failed to list sessions: {sessions_result['message']}")
             
             # 8. Health check
             print("\nHealth check:")
-            async with session.get(f"{base_url}/health") as response:
-                health = await response.json()
-                print(f"Service status: {health['status']}")
+            print(f"Service status: {health['status']}")
             
             # 9. Clean up - delete session
             print(f"\nDeleting session: {reference_id}")
-            async with session.delete(f"{base_url}/sessions/{reference_id}") as response:
-                delete_result = await response.json()
-                if delete_result["success"]:
-                    print("Session deleted successfully")
-                else:
-                    print(f"Failed to delete session: {delete_result['message']}")
+            delete_result = await request("DELETE", f"/sessions/{reference_id}")
+            if delete_result["success"]:
+                print("Session deleted successfully")
+            else:
+                print(f"Failed to delete session: {delete_result['message']}")
         
         except aiohttp.ClientError as e:
             print(f"API request failed: {str(e)}")
@@ -5,38 +5,81 @@ Supports interactive, structured input, and API modes.
 """
 
 import asyncio
-import json
+import csv
 import sys
 import os
-from typing import Dict, Any, Optional
+import tempfile
+import threading
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Sequence
 from pathlib import Path
 
 import click
-import uvicorn
+import orjson
 from rich.console import Console
-from rich.prompt import Prompt, Confirm
+from rich.prompt import Prompt
 from rich.table import Table
 from rich.panel import Panel
-from rich.text import Text
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-# Now import from src
-from src.agent.database_agent import get_agent
+# Now import from src (the agent stack, uvicorn and FastAPI are imported by the modes that use them)
 from src.utils.logger import setup_logging
-from config.settings import settings, validate_settings
+from config.settings import validate_settings
 
 console = Console()
 
+# Choices for the interactive operations menu
+OPERATION_CHOICES = ("1", "2", "3", "4", "5")
+DATABASE_TYPE_CHOICES = ("postgresql", "mysql")
+
+# Known-good credentials exercised by test mode (read-only so checks cannot alter them)
+TEST_CREDENTIALS = MappingProxyType({
+    "database_type": "postgresql",
+    "host": "localhost",
+    "port": 5432,
+    "username": "testuser",
+    "password": "testpass"
+})
+
+# Result sets larger than this are shown in part and saved to CSV in full
+MAX_DISPLAY_ROWS = 1000
+
+# Fields of each list_tables entry, in display order
+TABLE_LISTING_COLUMNS = ("schema", "table", "owner", "table_type")
+
+
+def fast_prompt(message: str, choices: Optional[Sequence[str]] = None, default: Optional[str] = None) -> str:
+    """Prompt for a value, reading stdin directly when it is not a terminal.
+    
+    Piped/scripted input skips Rich's prompt rendering; terminal users get
+    the usual Rich prompt.
+    """
+    if sys.stdin.isatty():
+        return Prompt.ask(message, choices=list(choices) if choices else None, default=default)
+    
+    while True:
+        sys.stdout.write(f"{message}: ")
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        
+        answer = line.strip() or (default if default is not None else "")
+        if choices is None or answer in choices:
+            return answer
+        sys.stdout.write("Please select one of the available options\n")
+
 
 def load_config_file(config_path: str) -> Dict[str, Any]:
     """Load configuration from JSON file."""
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
-    except Exception as e:
+        # Parse the raw bytes; no text-mode decode pass
+        return orjson.loads(Path(config_path).read_bytes())
+    except (OSError, orjson.JSONDecodeError) as e:
         console.print(f"[red]Error loading config file: {str(e)}[/red]")
         sys.exit(1)
 
@@ -72,13 +115,7 @@ async def test_mode():
         # Test credential validation
         console.print("\n[bold]Testing Credential Validation[/bold]")
         
-        valid_credentials = {
-            "database_type": "postgresql",
-            "host": "localhost",
-            "port": 5432,
-            "username": "testuser",
-            "password": "testpass"
-        }
+        valid_credentials = TEST_CREDENTIALS
         
         errors = InputValidator.validate_credentials(valid_credentials)
         if not errors:
@@ -111,9 +148,7 @@ async def test_mode():
         else:
             console.print(f"  ❌ PostgreSQL validation: {postgres_errors}")
         
-        mysql_credentials = valid_credentials.copy()
-        mysql_credentials["database_type"] = "mysql"
-        mysql_credentials["port"] = 3306
+        mysql_credentials = {**valid_credentials, "database_type": "mysql", "port": 3306}
         
         mysql_errors = ConnectionValidator.validate_mysql_connection(mysql_credentials)
         if not mysql_errors:
@@ -124,9 +159,9 @@ async def test_mode():
         # Test encryption utilities
         console.print("\n[bold]Testing Encryption Utilities[/bold]")
         
-        from src.storage.encryption import EncryptionManager
+        from src.storage.encryption import get_encryption_manager
         
-        encryption_manager = EncryptionManager()
+        encryption_manager = get_encryption_manager()
         
         # Test encryption/decryption
         test_data = "sensitive_database_password"
@@ -158,6 +193,59 @@ async def test_mode():
         console.print(f"[red]Test error: {str(e)}[/red]")
 
 
+async def run_blocking_prompts(prompts):
+    """Run blocking prompt code on a daemon thread while the event loop keeps working.
+    
+    A daemon thread (rather than the default executor) means a Ctrl-C while the
+    user is typing does not leave interpreter shutdown waiting on stdin.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def settle(setter, value):
+        if not future.done():
+            setter(value)
+    
+    def run():
+        try:
+            result = prompts()
+        except BaseException as e:
+            loop.call_soon_threadsafe(settle, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(settle, future.set_result, result)
+    
+    threading.Thread(target=run, daemon=True).start()
+    return await future
+
+
+def collect_credentials() -> Dict[str, Any]:
+    """Prompt for database credentials."""
+    database_type = fast_prompt(
+        "Database type",
+        choices=DATABASE_TYPE_CHOICES,
+        default="postgresql"
+    )
+    
+    host = fast_prompt("Host", default="localhost")
+    port = int(fast_prompt("Port", default="5432" if database_type == "postgresql" else "3306"))
+    username = fast_prompt("Username")
+    password = Prompt.ask("Password", password=True)
+    database_name = fast_prompt("Database name (optional)", default="")
+    
+    credentials = {
+        "database_type": database_type,
+        "host": host,
+        "port": port,
+        "username": username,
+        "password": password
+    }
+    
+    if database_name:
+        credentials["database_name"] = database_name
+    
+    return credentials
+
+
 async def interactive_mode():
     """Run agent in interactive mode."""
     console.print(Panel.fit(
@@ -166,7 +254,11 @@ async def interactive_mode():
         title="Welcome"
     ))
     
+    reference_id = None
+    credentials = None
     try:
+        from src.agent.database_agent import get_agent
+        
         # Initialize agent
         agent = await get_agent()
         
@@ -181,29 +273,7 @@ async def interactive_mode():
         
         # Collect credentials interactively
         console.print("\n[bold]Database Connection Setup[/bold]")
-        
-        database_type = Prompt.ask(
-            "Database type",
-            choices=["postgresql", "mysql"],
-            default="postgresql"
-        )
-        
-        host = Prompt.ask("Host", default="localhost")
-        port = int(Prompt.ask("Port", default="5432" if database_type == "postgresql" else "3306"))
-        username = Prompt.ask("Username")
-        password = Prompt.ask("Password", password=True)
-        database_name = Prompt.ask("Database name (optional)", default="")
-        
-        credentials = {
-            "database_type": database_type,
-            "host": host,
-            "port": port,
-            "username": username,
-            "password": password
-        }
-        
-        if database_name:
-            credentials["database_name"] = database_name
+        credentials = await run_blocking_prompts(collect_credentials)
         
         # Connect to database
         console.print("\n[bold]Testing connection...[/bold]")
@@ -224,6 +294,10 @@ async def interactive_mode():
     except Exception as e:
         console.print(f"[red]Unexpected error: {str(e)}[/red]")
     finally:
+        # Don't leave an unused session behind if the prompts were abandoned
+        if reference_id is not None and credentials is None:
+            await agent.delete_session(reference_id)
+        
         # Cleanup
         if 'agent' in locals():
             await agent.cleanup()
@@ -239,7 +313,7 @@ async def interactive_operations(agent, reference_id: str):
         console.print("4. Show session info")
         console.print("5. Exit")
         
-        choice = Prompt.ask("Choose operation", choices=["1", "2", "3", "4", "5"])
+        choice = fast_prompt("Choose operation", choices=OPERATION_CHOICES)
         
         if choice == "1":
             await execute_query_interactive(agent, reference_id)
@@ -254,9 +328,30 @@ async def interactive_operations(agent, reference_id: str):
             break
 
 
+def write_rows_csv(path: str, columns: list, rows: list) -> None:
+    """Write result rows to a CSV file, replacing any previous contents."""
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+async def save_overflow_rows(reference_id: str, kind: str, columns: list, rows: list) -> str:
+    """Save a result set too large to display and return the CSV path.
+    
+    Each session reuses one file per kind of result, so repeated large
+    results overwrite it instead of piling up in the temp directory.
+    """
+    safe_reference = "".join(c if c.isalnum() else "_" for c in reference_id)
+    path = os.path.join(tempfile.gettempdir(), f"{safe_reference}_{kind}.csv")
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, write_rows_csv, path, columns, rows)
+    return path
+
+
 async def execute_query_interactive(agent, reference_id: str):
     """Execute query interactively."""
-    query = Prompt.ask("Enter SQL query")
+    query = fast_prompt("Enter SQL query")
     if not query:
         return
     
@@ -275,10 +370,24 @@ async def execute_query_interactive(agent, reference_id: str):
                 table.add_column(col)
             
             rows = data.get("rows", [])
-            for row in rows:
-                table.add_row(*[str(row.get(col, "")) for col in columns])
+            if columns:
+                # itemgetter pulls every column of a row in one C call
+                # (returning a bare value, not a tuple, for a single column)
+                get_cells = itemgetter(*columns)
+                single_column = len(columns) == 1
+                for row in rows[:MAX_DISPLAY_ROWS]:
+                    cells = get_cells(row)
+                    table.add_row(*((str(cells),) if single_column else map(str, cells)))
             
             console.print(table)
+            
+            # Large result sets: keep the rendered table bounded, save the rest
+            if len(rows) > MAX_DISPLAY_ROWS:
+                csv_path = await save_overflow_rows(reference_id, "query_results", columns, rows)
+                console.print(
+                    f"[yellow]Showing first {MAX_DISPLAY_ROWS} of {len(rows)} rows; "
+                    f"full results saved to {csv_path}[/yellow]"
+                )
         else:
             console.print(f"Rows affected: {data.get('row_count', 0)}")
     else:
@@ -299,7 +408,7 @@ async def list_tables_interactive(agent, reference_id: str):
             table.add_column("Owner")
             table.add_column("Type")
             
-            for t in tables:
+            for t in tables[:MAX_DISPLAY_ROWS]:
                 table.add_row(
                     str(t.get("schema", "")),
                     str(t.get("table", "")),
@@ -308,6 +417,14 @@ async def list_tables_interactive(agent, reference_id: str):
                 )
             
             console.print(table)
+            
+            # Large schemas: keep the rendered table bounded, save the rest
+            if len(tables) > MAX_DISPLAY_ROWS:
+                csv_path = await save_overflow_rows(reference_id, "tables", TABLE_LISTING_COLUMNS, tables)
+                console.print(
+                    f"[yellow]Showing first {MAX_DISPLAY_ROWS} of {len(tables)} tables; "
+                    f"full listing saved to {csv_path}[/yellow]"
+                )
         else:
             console.print("[yellow]No tables found[/yellow]")
     else:
@@ -316,7 +433,7 @@ async def list_tables_interactive(agent, reference_id: str):
 
 async def get_schema_interactive(agent, reference_id: str):
     """Get schema interactively."""
-    table_name = Prompt.ask("Enter table name")
+    table_name = fast_prompt("Enter table name")
     if not table_name:
         return
     
@@ -378,6 +495,8 @@ async def structured_input_mode(config_path: str):
     config = load_config_file(config_path)
     
     try:
+        from src.agent.database_agent import get_agent
+        
         # Initialize agent
         agent = await get_agent()
         
@@ -437,16 +556,26 @@ async def execute_operations(agent, reference_id: str, operations: list):
                 console.print(f"[red]Failed to list tables: {result['message']}[/red]")
 
 
-def run_api_server(host: str, port: int):
-    """Run the API server."""
+def build_app():
+    """Build the API application (also used as the uvicorn factory for worker processes)."""
     from fastapi import FastAPI, HTTPException
-    from pydantic import BaseModel
+    from fastapi.responses import ORJSONResponse, Response
+    from pydantic import BaseModel, ConfigDict
     from typing import Optional, Dict, Any
     
-    app = FastAPI(title="Database Interface Agent API", version="1.0.0")
+    from src.agent.database_agent import get_agent
+    
+    # Handlers return plain dicts, which orjson encodes directly
+    app = FastAPI(
+        title="Database Interface Agent API",
+        version="1.0.0",
+        default_response_class=ORJSONResponse
+    )
     
     # Pydantic models
     class ConnectionRequest(BaseModel):
+        model_config = ConfigDict(extra="forbid")
+        
         database_type: str
         host: str
         port: int
@@ -455,11 +584,28 @@ def run_api_server(host: str, port: int):
         database_name: Optional[str] = None
     
     class QueryRequest(BaseModel):
+        model_config = ConfigDict(extra="forbid")
+        
         query: str
     
     class SchemaRequest(BaseModel):
+        model_config = ConfigDict(extra="forbid")
+        
         table_name: str
     
+    def encode_default(obj: Any) -> Any:
+        """Encode pydantic models (e.g. MCP tool results) that orjson can't."""
+        if isinstance(obj, BaseModel):
+            return obj.model_dump(mode="json")
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+    
+    def json_response(result: Dict[str, Any]) -> Response:
+        """Serialize an agent result with orjson, bypassing jsonable_encoder."""
+        return Response(
+            content=orjson.dumps(result, default=encode_default),
+            media_type="application/json"
+        )
+    
     # Global agent instance
     agent_instance = None
     
@@ -478,7 +624,7 @@ def run_api_server(host: str, port: int):
         """Create a new session."""
         try:
             result = await agent_instance.create_session()
-            return result
+            return json_response(result)
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -486,9 +632,9 @@ def run_api_server(host: str, port: int):
     async def connect_database(reference_id: str, request: ConnectionRequest):
         """Connect to database."""
         try:
-            credentials = request.dict()
+            credentials = request.model_dump()
             result = await agent_instance.connect_database(reference_id, credentials)
-            return result
+            return json_response(result)
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -497,7 +643,7 @@ def run_api_server(host: str, port: int):
         """Execute a database query."""
         try:
             result = await agent_instance.execute_query(reference_id, request.query)
-            return result
+            return json_response(result)
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -506,7 +652,7 @@ def run_api_server(host: str, port: int):
         """List tables in database."""
         try:
             result = await agent_instance.list_tables(reference_id)
-            return result
+            return json_response(result)
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -515,7 +661,7 @@ def run_api_server(host: str, port: int):
         """Get table schema."""
         try:
             result = await agent_instance.get_schema(reference_id, request.table_name)
-            return result
+            return json_response(result)
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -524,7 +670,7 @@ def run_api_server(host: str, port: int):
         """Get session information."""
         try:
             result = await agent_instance.get_session_info(reference_id)
-            return result
+            return json_response(result)
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -533,7 +679,7 @@ def run_api_server(host: str, port: int):
         """List all sessions."""
         try:
             result = await agent_instance.list_sessions()
-            return result
+            return json_response(result)
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -542,7 +688,7 @@ def run_api_server(host: str, port: int):
         """Delete a session."""
         try:
             result = await agent_instance.delete_session(reference_id)
-            return result
+            return json_response(result)
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
@@ -551,8 +697,35 @@ def run_api_server(host: str, port: int):
         """Health check endpoint."""
         return {"status": "healthy", "service": "Database Interface Agent"}
     
-    # Run the server
-    uvicorn.run(app, host=host, port=port)
+    return app
+
+
+def run_api_server(host: str, port: int, workers: int = 1):
+    """Run the API server."""
+    import uvicorn
+    
+    # "auto" picks uvloop and httptools when installed (uvicorn[standard]) and
+    # falls back to asyncio and h11 where they are not, e.g. uvloop on Windows
+    server_options = {
+        "host": host,
+        "port": port,
+        "loop": "auto",
+        "http": "auto",
+    }
+    
+    if workers > 1:
+        # Worker processes import the factory themselves; resolve it from the
+        # project root so the server can be started from any directory
+        module_name = "scripts.run_agent" if __name__ == "__main__" else __name__
+        uvicorn.run(
+            f"{module_name}:build_app",
+            factory=True,
+            workers=workers,
+            app_dir=str(project_root),
+            **server_options
+        )
+    else:
+        uvicorn.run(build_app(), **server_options)
 
 
 @click.command()
@@ -561,9 +734,10 @@ def run_api_server(host: str, port: int):
 @click.option("--api", is_flag=True, help="Run as API server")
 @click.option("--host", default="0.0.0.0", help="API server host (default: 0.0.0.0)")
 @click.option("--port", default=8000, help="API server port (default: 8000)")
+@click.option("--workers", default=1, help="API server worker processes (default: 1)")
 @click.option("--log-level", default="INFO", help="Log level (default: INFO)")
 @click.option("--test", is_flag=True, help="Run in test mode (no Redis required)")
-def main(interactive, config, api, host, port, log_level, test):
+def main(interactive, config, api, host, port, workers, log_level, test):
     """Database Interface Agent CLI."""
     
     # Setup logging
@@ -580,7 +754,7 @@ def main(interactive, config, api, host, port, log_level, test):
         asyncio.run(test_mode())
     elif api:
         console.print(f"[bold]Starting API server on {host}:{port}[/bold]")
-        run_api_server(host, port)
+        run_api_server(host, port, workers)
     elif config:
         asyncio.run(structured_input_mode(config))
     elif interactive:
@@ -591,5 +765,13 @@ def main(interactive, config, api, host, port, log_level, test):
         asyncio.run(test_mode())
 
 
+def main_with_args(argv: List[str]) -> Any:
+    """Run the CLI in-process with explicit arguments (for tests and embedding).
+    
+    Click parses argv instead of sys.argv and returns instead of calling sys.exit.
+    """
+    return main.main(args=argv, standalone_mode=False)
+
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
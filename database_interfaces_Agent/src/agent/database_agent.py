@@ -4,29 +4,88 @@ Orchestrates all components and provides the main interface.
 """
 
 import asyncio
-from typing import Dict, Any, Optional, List
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Dict, Any, Optional, List
 from datetime import datetime
 
-from langgraph.graph import StateGraph
-from langgraph.checkpoint.memory import MemorySaver
-
+from config.settings import get_settings
 from src.agent.state import AgentState, StateManager, AgentStatus
-from src.agent.workflows import get_workflow
-from src.mcp.client import mcp_client
 from src.storage.session_store import get_session_store
 from src.utils.logger import get_logger, AgentLogger
 
+# LangGraph and the MCP client are heavy to import; load them on first use
+if TYPE_CHECKING:
+    from langgraph.checkpoint.memory import MemorySaver
+    from langgraph.graph import StateGraph
+
 logger = get_logger(__name__)
 
 
+def _safe_rpc(action: str, message: str):
+    """Turn an exception raised by an agent method into a failure response."""
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Error {action}: {str(e)}")
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "message": message
+                }
+        return wrapper
+    return decorator
+
+
+# Upper bound on per-session agent loggers kept by an agent
+MAX_CACHED_LOGGERS = 1024
+
+
+@lru_cache(maxsize=1024)
+def _thread_config(reference_id: str) -> Dict[str, Any]:
+    """Get the (shared, read-only) workflow run config for a reference ID."""
+    return {"configurable": {"thread_id": reference_id}}
+
+
 class DatabaseInterfaceAgent:
     """Main Database Interface Agent class."""
     
     def __init__(self):
-        self.workflow: Optional[StateGraph] = None
-        self.memory_saver = MemorySaver()
-        self.agent_logger: Optional[AgentLogger] = None
+        self.workflow: Optional["StateGraph"] = None
+        self.memory_saver: Optional["MemorySaver"] = None
+        self._loggers: Dict[str, AgentLogger] = {}
         self.is_initialized = False
+        self._session_store = None
+        self._init_lock: Optional[asyncio.Lock] = None
+    
+    def _get_logger(self, reference_id: str, session_id: Optional[str] = None) -> AgentLogger:
+        """Get the agent logger for a session, creating it on first use."""
+        agent_logger = self._loggers.get(reference_id)
+        if agent_logger is None:
+            if len(self._loggers) >= MAX_CACHED_LOGGERS:
+                # Evict the oldest session's logger
+                del self._loggers[next(iter(self._loggers))]
+            agent_logger = AgentLogger(
+                agent_id=f"agent_{reference_id}",
+                session_id=session_id or reference_id
+            )
+            self._loggers[reference_id] = agent_logger
+        return agent_logger
+    
+    async def _ensure_ready(self) -> None:
+        """Initialize the agent once, even when called concurrently."""
+        if self.is_initialized:
+            return
+        # Created lazily so the lock belongs to the running event loop
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        async with self._init_lock:
+            if not self.is_initialized:
+                await self.initialize()
+        if not self.is_initialized:
+            raise RuntimeError("Database Interface Agent failed to initialize")
     
     async def initialize(self) -> bool:
         """Initialize the agent."""
@@ -37,15 +96,23 @@ class DatabaseInterfaceAgent:
             session_store = await get_session_store()
             if not session_store.redis_client:
                 await session_store.initialize()
+            self._session_store = session_store
             
             # Initialize MCP client
             # (MCP client is initialized on import)
             
             # Create workflow
+            from src.agent.workflows import get_workflow
             self.workflow = get_workflow()
             
-            # Compile workflow
-            self.app = self.workflow.compile(checkpointer=self.memory_saver)
+            # Compile workflow; only checkpoint every step when persistence is wanted
+            if get_settings().persist_checkpoints:
+                if self.memory_saver is None:
+                    from langgraph.checkpoint.memory import MemorySaver
+                    self.memory_saver = MemorySaver()
+                self.app = self.workflow.compile(checkpointer=self.memory_saver)
+            else:
+                self.app = self.workflow.compile()
             
             self.is_initialized = True
             logger.info("Database Interface Agent initialized successfully")
@@ -55,46 +122,33 @@ class DatabaseInterfaceAgent:
             logger.error(f"Failed to initialize agent: {str(e)}")
             return False
     
+    @_safe_rpc("creating session", "Failed to create session")
     async def create_session(self, ttl: Optional[int] = None) -> Dict[str, Any]:
         """Create a new agent session."""
-        try:
-            if not self.is_initialized:
-                await self.initialize()
-            
-            # Create session in store
-            session_store = await get_session_store()
-            session = await session_store.create_session(ttl)
-            
-            # Create initial state
-            initial_state = StateManager.create_initial_state(
-                reference_id=session.reference_id,
-                is_interactive=True
-            )
-            
-            # Initialize agent logger
-            self.agent_logger = AgentLogger(
-                agent_id=f"agent_{session.reference_id}",
-                session_id=session.session_id
-            )
-            
-            self.agent_logger.session_created(session.reference_id, session.ttl)
-            
-            return {
-                "success": True,
-                "reference_id": session.reference_id,
-                "session_id": session.session_id,
-                "ttl": session.ttl,
-                "created_at": session.created_at.isoformat(),
-                "message": f"Session created successfully: {session.reference_id}"
-            }
-            
-        except Exception as e:
-            logger.error(f"Error creating session: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "message": "Failed to create session"
-            }
+        await self._ensure_ready()
+        
+        # Create session in store
+        session_store = self._session_store
+        session = await session_store.create_session(ttl)
+        
+        # Create initial state
+        initial_state = StateManager.create_initial_state(
+            reference_id=session.reference_id,
+            is_interactive=True
+        )
+        
+        # Initialize agent logger
+        agent_logger = self._get_logger(session.reference_id, session.session_id)
+        agent_logger.session_created(session.reference_id, session.ttl)
+        
+        return {
+            "success": True,
+            "reference_id": session.reference_id,
+            "session_id": session.session_id,
+            "ttl": session.ttl,
+            "created_at": session.created_at.isoformat(),
+            "message": f"Session created successfully: {session.reference_id}"
+        }
     
     async def connect_database(
         self,
@@ -104,8 +158,7 @@ class DatabaseInterfaceAgent:
     ) -> Dict[str, Any]:
         """Connect to database using provided credentials."""
         try:
-            if not self.is_initialized:
-                await self.initialize()
+            await self._ensure_ready()
             
             # Create initial state
             initial_state = StateManager.create_initial_state(
@@ -118,37 +171,27 @@ class DatabaseInterfaceAgent:
                 initial_state.structured_input = credentials
             
             # Initialize agent logger
-            self.agent_logger = AgentLogger(
-                agent_id=f"agent_{reference_id}",
-                session_id=reference_id
-            )
+            agent_logger = self._get_logger(reference_id)
             
             # Run workflow
-            config = {"configurable": {"thread_id": reference_id}}
-            result = await self.app.ainvoke(initial_state, config)
+            result = await self.app.ainvoke(initial_state, _thread_config(reference_id))
             
             # Extract final state
             final_state = result.get("__end__", initial_state)
             
+            connected = final_state.connection_status.value == "success"
+            
             # Log connection attempt
-            if final_state.connection_status.value == "success":
-                self.agent_logger.connection_test(
-                    credentials.get("database_type", "unknown"),
-                    credentials.get("host", "unknown"),
-                    credentials.get("port", 0),
-                    True
-                )
-            else:
-                self.agent_logger.connection_test(
-                    credentials.get("database_type", "unknown"),
-                    credentials.get("host", "unknown"),
-                    credentials.get("port", 0),
-                    False,
-                    error=final_state.connection_error
-                )
+            agent_logger.connection_test(
+                credentials.get("database_type", "unknown"),
+                credentials.get("host", "unknown"),
+                credentials.get("port", 0),
+                connected,
+                error=None if connected else final_state.connection_error
+            )
             
             return {
-                "success": final_state.connection_status.value == "success",
+                "success": connected,
                 "reference_id": reference_id,
                 "status": final_state.agent_status.value,
                 "message": final_state.response_message,
@@ -166,273 +209,277 @@ class DatabaseInterfaceAgent:
                 "message": "Failed to connect to database"
             }
     
+    @_safe_rpc("executing query", "Failed to execute query")
     async def execute_query(
         self,
         reference_id: str,
         query: str
     ) -> Dict[str, Any]:
         """Execute a database query."""
-        try:
-            if not self.is_initialized:
-                await self.initialize()
-            
-            # Get session
-            session_store = await get_session_store()
-            session = await session_store.get_session_by_reference_id(reference_id)
-            
-            if not session:
-                return {
-                    "success": False,
-                    "error": "Session not found",
-                    "message": f"Session {reference_id} not found or expired"
-                }
-            
-            if not session.connection_config:
-                return {
-                    "success": False,
-                    "error": "No connection configuration",
-                    "message": "No database connection configured for this session"
-                }
-            
-            # Execute query using MCP
-            result = await mcp_client.execute_database_query(
-                session.connection_config,
-                query
-            )
-            
-            # Log query execution
-            if self.agent_logger:
-                self.agent_logger.tool_executed(
-                    "execute_query",
-                    result.get("success", False),
-                    query=query,
-                    row_count=result.get("data", {}).get("row_count", 0)
-                )
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error executing query: {str(e)}")
+        await self._ensure_ready()
+        
+        # Get session
+        session_store = self._session_store
+        session = await session_store.get_session_by_reference_id(reference_id)
+        
+        if not session:
             return {
                 "success": False,
-                "error": str(e),
-                "message": "Failed to execute query"
+                "error": "Session not found",
+                "message": f"Session {reference_id} not found or expired"
+            }
+        
+        if not session.connection_config:
+            return {
+                "success": False,
+                "error": "No connection configuration",
+                "message": "No database connection configured for this session"
             }
+        
+        # Execute query using MCP
+        from src.mcp.client import mcp_client
+        result = await mcp_client.execute_database_query(
+            session.connection_config,
+            query
+        )
+        
+        # Log query execution
+        self._get_logger(reference_id, session.session_id).tool_executed(
+            "execute_query",
+            result.get("success", False),
+            query=query,
+            row_count=result.get("data", {}).get("row_count", 0)
+        )
+        
+        return result
     
+    @_safe_rpc("listing tables", "Failed to list tables")
     async def list_tables(self, reference_id: str) -> Dict[str, Any]:
         """List tables in the database."""
-        try:
-            if not self.is_initialized:
-                await self.initialize()
-            
-            # Get session
-            session_store = await get_session_store()
-            session = await session_store.get_session_by_reference_id(reference_id)
-            
-            if not session:
-                return {
-                    "success": False,
-                    "error": "Session not found",
-                    "message": f"Session {reference_id} not found or expired"
-                }
-            
-            if not session.connection_config:
-                return {
-                    "success": False,
-                    "error": "No connection configuration",
-                    "message": "No database connection configured for this session"
-                }
-            
-            # List tables using MCP
-            result = await mcp_client.call_tool(
-                session.mcp_server_id or "temp",
-                "list_tables",
-                {
-                    "host": session.connection_config.host,
-                    "port": session.connection_config.port,
-                    "username": session.connection_config.username,
-                    "password": session.connection_config.password,
-                    "database_name": session.connection_config.database_name
-                }
-            )
-            
-            # Log table listing
-            if self.agent_logger:
-                self.agent_logger.tool_executed(
-                    "list_tables",
-                    True,
-                    table_count=len(result.get("tables", []))
-                )
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error listing tables: {str(e)}")
+        await self._ensure_ready()
+        
+        # Get session
+        session_store = self._session_store
+        session = await session_store.get_session_by_reference_id(reference_id)
+        
+        if not session:
             return {
                 "success": False,
-                "error": str(e),
-                "message": "Failed to list tables"
+                "error": "Session not found",
+                "message": f"Session {reference_id} not found or expired"
             }
+        
+        if not session.connection_config:
+            return {
+                "success": False,
+                "error": "No connection configuration",
+                "message": "No database connection configured for this session"
+            }
+        
+        # List tables using MCP
+        from src.mcp.client import mcp_client
+        result = await mcp_client.call_tool(
+            session.mcp_server_id or "temp",
+            "list_tables",
+            session.connection_config.mcp_arguments
+        )
+        
+        # Log table listing
+        self._get_logger(reference_id, session.session_id).tool_executed(
+            "list_tables",
+            True,
+            table_count=len(result.get("tables", []))
+        )
+        
+        return result
     
+    @_safe_rpc("getting schema", "Failed to get schema")
     async def get_schema(
         self,
         reference_id: str,
         table_name: str
     ) -> Dict[str, Any]:
         """Get schema information for a table."""
-        try:
-            if not self.is_initialized:
-                await self.initialize()
-            
-            # Get session
-            session_store = await get_session_store()
-            session = await session_store.get_session_by_reference_id(reference_id)
-            
-            if not session:
-                return {
-                    "success": False,
-                    "error": "Session not found",
-                    "message": f"Session {reference_id} not found or expired"
-                }
-            
-            if not session.connection_config:
-                return {
-                    "success": False,
-                    "error": "No connection configuration",
-                    "message": "No database connection configured for this session"
-                }
-            
-            # Get schema using MCP
-            result = await mcp_client.call_tool(
-                session.mcp_server_id or "temp",
-                "get_schema",
-                {
-                    "host": session.connection_config.host,
-                    "port": session.connection_config.port,
-                    "username": session.connection_config.username,
-                    "password": session.connection_config.password,
-                    "database_name": session.connection_config.database_name,
-                    "table_name": table_name
-                }
-            )
-            
-            # Log schema retrieval
-            if self.agent_logger:
-                self.agent_logger.tool_executed(
-                    "get_schema",
-                    True,
-                    table_name=table_name,
-                    column_count=len(result.get("columns", []))
-                )
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error getting schema: {str(e)}")
+        await self._ensure_ready()
+        
+        # Get session
+        session_store = self._session_store
+        session = await session_store.get_session_by_reference_id(reference_id)
+        
+        if not session:
             return {
                 "success": False,
-                "error": str(e),
-                "message": "Failed to get schema"
-            }
-    
-    async def get_session_info(self, reference_id: str) -> Dict[str, Any]:
-        """Get information about a session."""
-        try:
-            if not self.is_initialized:
-                await self.initialize()
-            
-            # Get session
-            session_store = await get_session_store()
-            session = await session_store.get_session_by_reference_id(reference_id)
-            
-            if not session:
-                return {
-                    "success": False,
-                    "error": "Session not found",
-                    "message": f"Session {reference_id} not found or expired"
-                }
-            
-            return {
-                "success": True,
-                "session": {
-                    "reference_id": session.reference_id,
-                    "session_id": session.session_id,
-                    "created_at": session.created_at.isoformat(),
-                    "last_accessed": session.last_accessed.isoformat(),
-                    "ttl": session.ttl,
-                    "is_active": session.is_active,
-                    "agent_status": session.agent_status.value,
-                    "connection_status": session.connection_status.value,
-                    "connection_tested_at": session.connection_tested_at.isoformat() if session.connection_tested_at else None,
-                    "mcp_server_active": session.mcp_server_active,
-                    "mcp_server_id": session.mcp_server_id
-                }
+                "error": "Session not found",
+                "message": f"Session {reference_id} not found or expired"
             }
-            
-        except Exception as e:
-            logger.error(f"Error getting session info: {str(e)}")
+        
+        if not session.connection_config:
             return {
                 "success": False,
-                "error": str(e),
-                "message": "Failed to get session information"
+                "error": "No connection configuration",
+                "message": "No database connection configured for this session"
             }
+        
+        # Get schema using MCP
+        from src.mcp.client import mcp_client
+        result = await mcp_client.call_tool(
+            session.mcp_server_id or "temp",
+            "get_schema",
+            {**session.connection_config.mcp_arguments, "table_name": table_name}
+        )
+        
+        # Log schema retrieval
+        self._get_logger(reference_id, session.session_id).tool_executed(
+            "get_schema",
+            True,
+            table_name=table_name,
+            column_count=len(result.get("columns", []))
+        )
+        
+        return result
     
-    async def list_sessions(self) -> Dict[str, Any]:
-        """List all active sessions."""
-        try:
-            if not self.is_initialized:
-                await self.initialize()
-            
-            # Get sessions from store
-            session_store = await get_session_store()
-            sessions = await session_store.list_active_sessions()
-            
+    @_safe_rpc("describing tables", "Failed to get schemas")
+    async def bulk_describe(
+        self,
+        reference_id: str,
+        table_names: List[str]
+    ) -> Dict[str, Any]:
+        """Get schema information for several tables with one session lookup."""
+        await self._ensure_ready()
+        
+        # Get session once for all tables
+        session_store = self._session_store
+        session = await session_store.get_session_by_reference_id(reference_id)
+        
+        if not session:
             return {
-                "success": True,
-                "sessions": sessions,
-                "count": len(sessions)
+                "success": False,
+                "error": "Session not found",
+                "message": f"Session {reference_id} not found or expired"
             }
-            
-        except Exception as e:
-            logger.error(f"Error listing sessions: {str(e)}")
+        
+        if not session.connection_config:
             return {
                 "success": False,
-                "error": str(e),
-                "message": "Failed to list sessions"
+                "error": "No connection configuration",
+                "message": "No database connection configured for this session"
             }
-    
-    async def delete_session(self, reference_id: str) -> Dict[str, Any]:
-        """Delete a session."""
-        try:
-            if not self.is_initialized:
-                await self.initialize()
-            
-            # Delete session from store
-            session_store = await get_session_store()
-            success = await session_store.delete_session(reference_id)
-            
-            if success:
-                # Log session deletion
-                if self.agent_logger:
-                    self.agent_logger.info(f"Session {reference_id} deleted")
-                
-                return {
-                    "success": True,
-                    "message": f"Session {reference_id} deleted successfully"
+        
+        # Get all schemas concurrently using MCP
+        from src.mcp.client import mcp_client
+        server_id = session.mcp_server_id or "temp"
+        base_args = session.connection_config.mcp_arguments
+        results = await asyncio.gather(
+            *(
+                mcp_client.call_tool(server_id, "get_schema", {**base_args, "table_name": table_name})
+                for table_name in table_names
+            ),
+            return_exceptions=True
+        )
+        
+        schemas = {}
+        failed = 0
+        for table_name, result in zip(table_names, results):
+            if isinstance(result, Exception):
+                schema = {
+                    "success": False,
+                    "error": str(result),
+                    "message": "Failed to get schema"
                 }
             else:
-                return {
+                schema = mcp_client.parse_tool_result(result) or {
                     "success": False,
-                    "error": "Session not found",
-                    "message": f"Session {reference_id} not found"
+                    "message": "No response from database server"
                 }
+            if not schema.get("success"):
+                failed += 1
+            schemas[table_name] = schema
+        
+        # Log schema retrieval
+        self._get_logger(reference_id, session.session_id).tool_executed(
+            "bulk_describe",
+            failed == 0,
+            table_count=len(table_names),
+            failed_count=failed
+        )
+        
+        return {
+            "success": failed == 0,
+            "schemas": schemas,
+            "failed_count": failed
+        }
+    
+    @_safe_rpc("getting session info", "Failed to get session information")
+    async def get_session_info(self, reference_id: str) -> Dict[str, Any]:
+        """Get information about a session."""
+        await self._ensure_ready()
+        
+        # Get session
+        session_store = self._session_store
+        session = await session_store.get_session_by_reference_id(reference_id)
+        
+        if not session:
+            return {
+                "success": False,
+                "error": "Session not found",
+                "message": f"Session {reference_id} not found or expired"
+            }
+        
+        return {
+            "success": True,
+            "session": {
+                "reference_id": session.reference_id,
+                "session_id": session.session_id,
+                "created_at": session.created_at.isoformat(),
+                "last_accessed": session.last_accessed.isoformat(),
+                "ttl": session.ttl,
+                "is_active": session.is_active,
+                "agent_status": session.agent_status.value,
+                "connection_status": session.connection_status.value,
+                "connection_tested_at": session.connection_tested_at.isoformat() if session.connection_tested_at else None,
+                "mcp_server_active": session.mcp_server_active,
+                "mcp_server_id": session.mcp_server_id
+            }
+        }
+    
+    @_safe_rpc("listing sessions", "Failed to list sessions")
+    async def list_sessions(self) -> Dict[str, Any]:
+        """List all active sessions."""
+        await self._ensure_ready()
+        
+        # Get sessions from store
+        session_store = self._session_store
+        sessions = await session_store.list_active_sessions()
+        
+        return {
+            "success": True,
+            "sessions": sessions,
+            "count": len(sessions)
+        }
+    
+    @_safe_rpc("deleting session", "Failed to delete session")
+    async def delete_session(self, reference_id: str) -> Dict[str, Any]:
+        """Delete a session."""
+        await self._ensure_ready()
+        
+        # Delete session from store
+        session_store = self._session_store
+        success = await session_store.delete_session(reference_id)
+        
+        if success:
+            # Log session deletion
+            self._get_logger(reference_id).info(f"Session {reference_id} deleted")
+            self._loggers.pop(reference_id, None)
             
-        except Exception as e:
-            logger.error(f"Error deleting session: {str(e)}")
+            return {
+                "success": True,
+                "message": f"Session {reference_id} deleted successfully"
+            }
+        else:
             return {
                 "success": False,
-                "error": str(e),
-                "message": "Failed to delete session"
+                "error": "Session not found",
+                "message": f"Session {reference_id} not found"
             }
     
     async def cleanup(self) -> None:
@@ -440,12 +487,19 @@ class DatabaseInterfaceAgent:
         try:
             logger.info("Cleaning up Database Interface Agent")
             
-            # Clean up MCP servers
-            await mcp_client.cleanup_inactive_servers()
-            
-            # Clean up session store
-            session_store = await get_session_store()
-            await session_store.close()
+            # Clean up MCP servers and session store concurrently
+            from src.mcp.client import mcp_client
+            session_store = self._session_store or await get_session_store()
+            results = await asyncio.gather(
+                mcp_client.cleanup_inactive_servers(),
+                session_store.close(),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error during cleanup: {str(result)}")
+            self._session_store = None
+            self.is_initialized = False
             
             logger.info("Database Interface Agent cleanup completed")
             
@@ -459,6 +513,5 @@ agent = DatabaseInterfaceAgent()
 
 async def get_agent() -> DatabaseInterfaceAgent:
     """Get the global agent instance."""
-    if not agent.is_initialized:
-        await agent.initialize()
+    await agent._ensure_ready()
     return agent 
\ No newline at end of file
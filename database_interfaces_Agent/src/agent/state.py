@@ -3,14 +3,21 @@ State management for the Database Interface Agent.
 Defines the state structure used by LangGraph workflows.
 """
 
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, FrozenSet, Optional, List, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 from config.database_config import DatabaseConnectionConfig, DatabaseType
 
 
+# Oldest action log entries are dropped beyond this many
+MAX_ACTION_LOG_ENTRIES = 1024
+# Extra entries tolerated in memory so trimming happens in batches, not per append
+ACTION_LOG_TRIM_SLACK = MAX_ACTION_LOG_ENTRIES // 4
+
+
 class AgentStatus(str, Enum):
     """Agent status enumeration."""
     INITIALIZING = "initializing"
@@ -31,9 +38,15 @@ class ConnectionStatus(str, Enum):
     TIMEOUT = "timeout"
 
 
+# Agent statuses in which an established connection may be used
+_READY_STATUSES = frozenset({AgentStatus.CONNECTED, AgentStatus.READY})
+
+
 class SessionState(BaseModel):
     """Session state for tracking user interactions."""
     
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
     session_id: str
     reference_id: str
     created_at: datetime
@@ -60,14 +73,13 @@ class SessionState(BaseModel):
     mcp_server_active: bool = False
     mcp_server_id: Optional[str] = None
     mcp_last_activity: Optional[datetime] = None
-    
-    class Config:
-        arbitrary_types_allowed = True
 
 
 class AgentState(BaseModel):
     """Main agent state for LangGraph workflows."""
     
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
     # Session management
     session: Optional[SessionState] = None
     reference_id: Optional[str] = None
@@ -111,8 +123,14 @@ class AgentState(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now)
     action_log: List[Dict[str, Any]] = Field(default_factory=list)
     
-    class Config:
-        arbitrary_types_allowed = True
+    @field_serializer("action_log")
+    def _serialize_action_log(self, action_log: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Render the raw epoch-second timestamps as ISO 8601 on output."""
+        return [
+            {**entry, "timestamp": datetime.fromtimestamp(entry["timestamp"]).isoformat()}
+            if isinstance(entry.get("timestamp"), (int, float)) else entry
+            for entry in action_log[-MAX_ACTION_LOG_ENTRIES:]
+        ]
     
     def update_session(self, session: SessionState) -> None:
         """Update the session state."""
@@ -121,14 +139,17 @@ class AgentState(BaseModel):
     
     def add_action_log(self, action: str, details: Dict[str, Any]) -> None:
         """Add an action to the audit log."""
+        # Raw time.time() seconds; formatted only when the state is serialized
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),
             "action": action,
             "details": details,
             "step": self.current_step,
             "status": self.agent_status
         }
         self.action_log.append(log_entry)
+        if len(self.action_log) > MAX_ACTION_LOG_ENTRIES + ACTION_LOG_TRIM_SLACK:
+            del self.action_log[:-MAX_ACTION_LOG_ENTRIES]
     
     def set_connection_config(self, config: DatabaseConnectionConfig) -> None:
         """Set the database connection configuration."""
@@ -145,22 +166,20 @@ class AgentState(BaseModel):
         if not self.connection_config:
             return {}
         
+        # AgentState has no test timestamp of its own; it lives on the session
+        tested_at = self.session.connection_tested_at if self.session else None
         return {
-            "database_type": self.connection_config.database_type.value,
-            "host": self.connection_config.host,
-            "port": self.connection_config.port,
-            "database_name": self.connection_config.database_name,
-            "ssl_mode": self.connection_config.ssl_mode,
+            **self.connection_config.summary,
             "connection_status": self.connection_status.value,
-            "connection_tested_at": self.connection_tested_at.isoformat() if self.connection_tested_at else None
+            "connection_tested_at": tested_at.isoformat() if tested_at else None
         }
     
     def is_connection_ready(self) -> bool:
         """Check if the connection is ready for use."""
         return (
             self.connection_config is not None and
-            self.connection_status == ConnectionStatus.SUCCESS and
-            self.agent_status in [AgentStatus.CONNECTED, AgentStatus.READY]
+            self.connection_status is ConnectionStatus.SUCCESS and
+            self.agent_status in _READY_STATUSES
         )
     
     def reset_connection_state(self) -> None:
@@ -174,13 +193,43 @@ class AgentState(BaseModel):
         self.mcp_server_id = None
 
 
+_NO_TRANSITIONS: FrozenSet[AgentStatus] = frozenset()
+
+_VALID_TRANSITIONS: Dict[AgentStatus, FrozenSet[AgentStatus]] = {
+    AgentStatus.INITIALIZING: frozenset({AgentStatus.COLLECTING_CREDENTIALS, AgentStatus.ERROR}),
+    AgentStatus.COLLECTING_CREDENTIALS: frozenset({AgentStatus.TESTING_CONNECTION, AgentStatus.ERROR}),
+    AgentStatus.TESTING_CONNECTION: frozenset({AgentStatus.CONNECTED, AgentStatus.ERROR}),
+    AgentStatus.CONNECTED: frozenset({AgentStatus.READY, AgentStatus.DISCONNECTED, AgentStatus.ERROR}),
+    AgentStatus.READY: frozenset({AgentStatus.DISCONNECTED, AgentStatus.ERROR}),
+    AgentStatus.ERROR: frozenset({AgentStatus.INITIALIZING, AgentStatus.DISCONNECTED}),
+    AgentStatus.DISCONNECTED: frozenset({AgentStatus.INITIALIZING})
+}
+
+# Steps whose successor depends on the agent status: (status, next if matched, next otherwise)
+_CONDITIONAL_STEPS: Dict[str, Tuple[AgentStatus, str, str]] = {
+    "initialization": (AgentStatus.COLLECTING_CREDENTIALS, "collect_credentials", "error_handling"),
+    "collect_credentials": (AgentStatus.TESTING_CONNECTION, "test_connection", "error_handling"),
+    "test_connection": (AgentStatus.CONNECTED, "connection_success", "connection_failed")
+}
+
+_STEP_MAPPING: Dict[str, str] = {
+    "connection_success": "ready_state",
+    "connection_failed": "error_handling",
+    "ready_state": "wait_for_commands",
+    "error_handling": "cleanup"
+}
+
+
 class StateManager:
     """Manages state transitions and validation."""
     
     @staticmethod
     def create_initial_state(reference_id: Optional[str] = None, is_interactive: bool = True) -> AgentState:
-        """Create initial agent state."""
-        return AgentState(
+        """Create initial agent state.
+        
+        The arguments are already typed, so validation is skipped.
+        """
+        return AgentState.model_construct(
             reference_id=reference_id,
             is_interactive=is_interactive,
             current_step="initialization",
@@ -190,30 +239,13 @@ class StateManager:
     @staticmethod
     def validate_state_transition(current_state: AgentState, new_status: AgentStatus) -> bool:
         """Validate if a state transition is allowed."""
-        valid_transitions = {
-            AgentStatus.INITIALIZING: [AgentStatus.COLLECTING_CREDENTIALS, AgentStatus.ERROR],
-            AgentStatus.COLLECTING_CREDENTIALS: [AgentStatus.TESTING_CONNECTION, AgentStatus.ERROR],
-            AgentStatus.TESTING_CONNECTION: [AgentStatus.CONNECTED, AgentStatus.ERROR, AgentStatus.TIMEOUT],
-            AgentStatus.CONNECTED: [AgentStatus.READY, AgentStatus.DISCONNECTED, AgentStatus.ERROR],
-            AgentStatus.READY: [AgentStatus.DISCONNECTED, AgentStatus.ERROR],
-            AgentStatus.ERROR: [AgentStatus.INITIALIZING, AgentStatus.DISCONNECTED],
-            AgentStatus.DISCONNECTED: [AgentStatus.INITIALIZING]
-        }
-        
-        allowed_transitions = valid_transitions.get(current_state.agent_status, [])
-        return new_status in allowed_transitions
+        return new_status in _VALID_TRANSITIONS.get(current_state.agent_status, _NO_TRANSITIONS)
     
     @staticmethod
     def get_next_step(current_step: str, status: AgentStatus) -> str:
         """Determine the next step based on current state."""
-        step_mapping = {
-            "initialization": "collect_credentials" if status == AgentStatus.COLLECTING_CREDENTIALS else "error_handling",
-            "collect_credentials": "test_connection" if status == AgentStatus.TESTING_CONNECTION else "error_handling",
-            "test_connection": "connection_success" if status == AgentStatus.CONNECTED else "connection_failed",
-            "connection_success": "ready_state",
-            "connection_failed": "error_handling",
-            "ready_state": "wait_for_commands",
-            "error_handling": "cleanup"
-        }
-        
-        return step_mapping.get(current_step, "error_handling") 
\ No newline at end of file
+        conditional = _CONDITIONAL_STEPS.get(current_step)
+        if conditional is not None:
+            required_status, on_match, otherwise = conditional
+            return on_match if status is required_status else otherwise
+        return _STEP_MAPPING.get(current_step, "error_handling")
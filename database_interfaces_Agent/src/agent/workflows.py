@@ -3,7 +3,8 @@ LangGraph workflows for Database Interface Agent.
 Defines the stateful workflows for agent interactions.
 """
 
-from typing import Dict, Any, List
+import asyncio
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from langgraph.graph import StateGraph, END
@@ -12,7 +13,7 @@ from langgraph.prebuilt import ToolNode
 from src.agent.state import AgentState, AgentStatus, ConnectionStatus, StateManager
 from src.tools.connection_tools import get_connection_tools
 from src.mcp.client import mcp_client
-from src.storage.session_store import get_session_store
+from src.storage.session_store import SessionStore, get_session_store
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,6 +25,19 @@ class DatabaseAgentWorkflows:
     def __init__(self):
         self.tools = get_connection_tools()
         self.tool_node = ToolNode(self.tools)
+        self._session_store: Optional[SessionStore] = None
+        self._session_store_lock: Optional[asyncio.Lock] = None
+    
+    async def _store(self) -> SessionStore:
+        """Get the session store, resolving it once for all nodes."""
+        if self._session_store is None:
+            # Created lazily so the lock belongs to the running event loop
+            if self._session_store_lock is None:
+                self._session_store_lock = asyncio.Lock()
+            async with self._session_store_lock:
+                if self._session_store is None:
+                    self._session_store = await get_session_store()
+        return self._session_store
     
     def create_workflow(self) -> StateGraph:
         """Create the main agent workflow."""
@@ -118,7 +132,7 @@ class DatabaseAgentWorkflows:
             logger.info(f"Initializing agent for reference ID: {state.reference_id}")
             
             # Get or create session
-            session_store = await get_session_store()
+            session_store = await self._store()
             
             if state.reference_id:
                 # Try to retrieve existing session
@@ -281,15 +295,11 @@ class DatabaseAgentWorkflows:
         try:
             logger.info(f"Connection successful for session: {state.reference_id}")
             
-            # Update session with connection info
+            # Update session with connection info (persisted by ready_state)
             if state.session:
                 state.session.connection_status = ConnectionStatus.SUCCESS
                 state.session.connection_tested_at = datetime.now()
                 state.session.agent_status = AgentStatus.CONNECTED
-                
-                # Update session in store
-                session_store = await get_session_store()
-                await session_store.update_session(state.session)
             
             state.agent_status = AgentStatus.READY
             state.current_step = "ready_state"
@@ -319,15 +329,11 @@ class DatabaseAgentWorkflows:
         try:
             logger.error(f"Connection failed for session: {state.reference_id}")
             
-            # Update session with error info
+            # Update session with error info (persisted by cleanup)
             if state.session:
                 state.session.connection_status = ConnectionStatus.FAILED
                 state.session.connection_error = state.connection_error
                 state.session.agent_status = AgentStatus.ERROR
-                
-                # Update session in store
-                session_store = await get_session_store()
-                await session_store.update_session(state.session)
             
             state.agent_status = AgentStatus.ERROR
             state.current_step = "error_handling"
@@ -353,10 +359,10 @@ class DatabaseAgentWorkflows:
         try:
             logger.info(f"Agent ready for session: {state.reference_id}")
             
-            # Update session status
+            # Update session status and persist the changes made since test_connection
             if state.session:
                 state.session.agent_status = AgentStatus.READY
-                session_store = await get_session_store()
+                session_store = await self._store()
                 await session_store.update_session(state.session)
             
             state.agent_status = AgentStatus.READY
@@ -390,14 +396,10 @@ class DatabaseAgentWorkflows:
         try:
             logger.error(f"Error handling for session: {state.reference_id}")
             
-            # Update session with error info
+            # Update session with error info (persisted by cleanup)
             if state.session:
                 state.session.agent_status = AgentStatus.ERROR
                 state.session.connection_error = state.error_message
-                
-                # Update session in store
-                session_store = await get_session_store()
-                await session_store.update_session(state.session)
             
             state.agent_status = AgentStatus.ERROR
             state.current_step = "error_handling"
@@ -434,8 +436,8 @@ class DatabaseAgentWorkflows:
                 state.session.is_active = False
                 state.session.agent_status = AgentStatus.DISCONNECTED
                 
-                # Update session in store
-                session_store = await get_session_store()
+                # Single store write for everything since test_connection
+                session_store = await self._store()
                 await session_store.update_session(state.session)
             
             state.agent_status = AgentStatus.DISCONNECTED
@@ -460,13 +462,13 @@ class DatabaseAgentWorkflows:
     # Conditional edge functions
     def should_collect_credentials(self, state: AgentState) -> str:
         """Determine if should collect credentials."""
-        if state.agent_status == AgentStatus.ERROR:
+        if state.agent_status is AgentStatus.ERROR:
             return "error"
         return "collect_credentials"
     
     def should_validate_credentials(self, state: AgentState) -> str:
         """Determine if should validate credentials."""
-        if state.agent_status == AgentStatus.ERROR:
+        if state.agent_status is AgentStatus.ERROR:
             return "error"
         if state.structured_input:
             return "validate"
@@ -474,13 +476,13 @@ class DatabaseAgentWorkflows:
     
     def should_test_connection(self, state: AgentState) -> str:
         """Determine if should test connection."""
-        if state.agent_status == AgentStatus.ERROR:
+        if state.agent_status is AgentStatus.ERROR:
             return "error"
         return "test"
     
     def connection_test_result(self, state: AgentState) -> str:
         """Determine connection test result."""
-        if state.connection_status == ConnectionStatus.SUCCESS:
+        if state.connection_status is ConnectionStatus.SUCCESS:
             return "success"
         return "failed"
     
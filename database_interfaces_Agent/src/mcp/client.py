@@ -241,6 +241,18 @@ class DatabaseMCPClient(MCPClient):
             DatabaseType.MYSQL: "mysql_server"
         }
     
+    @staticmethod
+    def parse_tool_result(result: Optional[CallToolResult]) -> Optional[Dict[str, Any]]:
+        """Decode the JSON payload of a database tool result, if there is one."""
+        if result and result.content:
+            content = result.content[0]
+            if isinstance(content, TextContent):
+                try:
+                    return json.loads(content.text)
+                except json.JSONDecodeError:
+                    return None
+        return None
+    
     async def get_database_server_id(self, database_type: DatabaseType) -> str:
         """Get or create server ID for database type."""
         server_type = self.database_servers.get(database_type)
@@ -294,15 +306,7 @@ class DatabaseMCPClient(MCPClient):
                 }
             
             # Call test connection tool
-            arguments = {
-                "host": config.host,
-                "port": config.port,
-                "username": config.username,
-                "password": config.password,
-                "database_name": config.database_name
-            }
-            
-            result = await self.call_tool(server_id, "test_connection", arguments)
+            result = await self.call_tool(server_id, "test_connection", config.mcp_arguments)
             
             if result and result.content:
                 # Parse result content
@@ -344,14 +348,7 @@ class DatabaseMCPClient(MCPClient):
                 }
             
             # Call execute query tool
-            arguments = {
-                "host": config.host,
-                "port": config.port,
-                "username": config.username,
-                "password": config.password,
-                "database_name": config.database_name,
-                "query": query
-            }
+            arguments = {**config.mcp_arguments, "query": query}
             
             result = await self.call_tool(server_id, "execute_query", arguments)
             
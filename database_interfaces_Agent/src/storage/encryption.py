@@ -6,6 +6,7 @@ Handles encryption and decryption of credentials and session data.
 import base64
 import os
 import sys
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 from cryptography.fernet import Fernet
@@ -17,7 +18,7 @@ project_root = Path(__file__).parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from config.settings import settings
+from config.settings import get_settings
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -27,7 +28,7 @@ class EncryptionManager:
     """Manages encryption and decryption of sensitive data."""
     
     def __init__(self, encryption_key: Optional[str] = None):
-        self.encryption_key = encryption_key or settings.encryption_key
+        self.encryption_key = encryption_key or get_settings().encryption_key
         self.fernet = self._create_fernet()
     
     def _create_fernet(self) -> Fernet:
@@ -161,7 +162,7 @@ class SecureStorage:
     """Secure storage wrapper for sensitive data."""
     
     def __init__(self, encryption_manager: Optional[EncryptionManager] = None):
-        self.encryption_manager = encryption_manager or EncryptionManager()
+        self.encryption_manager = encryption_manager or get_encryption_manager()
     
     def store_secure_data(self, key: str, data: dict) -> str:
         """Store data securely with encryption."""
@@ -201,15 +202,15 @@ class SecureStorage:
             raise
 
 
-# Global encryption manager instance
-encryption_manager = EncryptionManager()
-
-
+@lru_cache(maxsize=1)
 def get_encryption_manager() -> EncryptionManager:
-    """Get the global encryption manager instance."""
-    return encryption_manager
+    """Get the global encryption manager instance.
+    
+    The key derivation (PBKDF2) runs once, on first use rather than at import.
+    """
+    return EncryptionManager()
 
 
 def get_secure_storage() -> SecureStorage:
     """Get a secure storage instance."""
-    return SecureStorage(encryption_manager) 
\ No newline at end of file
+    return SecureStorage(get_encryption_manager()) 
\ No newline at end of file
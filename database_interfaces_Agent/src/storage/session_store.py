@@ -19,9 +19,9 @@ project_root = Path(__file__).parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from config.settings import settings
+from config.settings import get_settings
 from src.agent.state import SessionState
-from src.storage.encryption import EncryptionManager
+from src.storage.encryption import get_encryption_manager
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -32,22 +32,32 @@ class SessionStore:
     
     def __init__(self):
         self.redis_client: Optional[redis.Redis] = None
-        self.encryption_manager = EncryptionManager()
+        self._owns_pool = False
+        self.encryption_manager = get_encryption_manager()
         self.session_prefix = "db_agent_session:"
         self.reference_prefix = "db_agent_ref:"
         
-    async def initialize(self) -> bool:
-        """Initialize Redis connection."""
+    async def initialize(self, pool: Optional[redis.ConnectionPool] = None) -> bool:
+        """Initialize Redis connection.
+        
+        Pass ``pool`` to share an existing connection pool; otherwise one sized
+        by ``REDIS_POOL_SIZE`` is created and owned by this store.
+        """
         try:
-            self.redis_client = redis.Redis(
-                host=settings.redis_host,
-                port=settings.redis_port,
-                db=settings.redis_db,
-                password=settings.redis_password,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5
-            )
+            self._owns_pool = pool is None
+            if pool is None:
+                settings = get_settings()
+                pool = redis.ConnectionPool(
+                    host=settings.redis_host,
+                    port=settings.redis_port,
+                    db=settings.redis_db,
+                    password=settings.redis_password,
+                    decode_responses=True,
+                    socket_connect_timeout=5,
+                    socket_timeout=5,
+                    max_connections=settings.redis_pool_size
+                )
+            self.redis_client = redis.Redis(connection_pool=pool)
             
             # Test connection
             await self.redis_client.ping()
@@ -62,6 +72,9 @@ class SessionStore:
         """Close Redis connection."""
         if self.redis_client:
             await self.redis_client.close()
+            # A shared pool is left for its owner to disconnect
+            if self._owns_pool:
+                await self.redis_client.connection_pool.disconnect()
             logger.info("Session store connection closed")
     
     def _generate_session_id(self) -> str:
@@ -79,13 +92,15 @@ class SessionStore:
             reference_id = self._generate_reference_id()
             
             if ttl is None:
-                ttl = settings.session_ttl
+                ttl = get_settings().session_ttl
             
-            session = SessionState(
+            # Built from generated values, so skip validation
+            now = datetime.now()
+            session = SessionState.model_construct(
                 session_id=session_id,
                 reference_id=reference_id,
-                created_at=datetime.now(),
-                last_accessed=datetime.now(),
+                created_at=now,
+                last_accessed=now,
                 ttl=ttl,
                 is_active=True
             )
@@ -137,9 +152,11 @@ class SessionStore:
             # Update last accessed time
             session.last_accessed = datetime.now()
             
-            # Refresh TTL
-            await self.redis_client.expire(session_id, session.ttl)
-            await self.redis_client.expire(reference_id, session.ttl)
+            # Refresh both TTLs in a single round trip
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.expire(session_id, session.ttl)
+                pipe.expire(reference_id, session.ttl)
+                await pipe.execute()
             
             logger.info(f"Retrieved session {reference_id}")
             return session
@@ -269,6 +286,7 @@ class SessionStore:
             memory_info = await self.redis_client.info("memory")
             used_memory = memory_info.get("used_memory_human", "N/A")
             
+            settings = get_settings()
             stats = {
                 "total_sessions": total_sessions,
                 "total_references": total_references,
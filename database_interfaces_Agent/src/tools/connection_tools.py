@@ -165,7 +165,7 @@ class TestConnectionTool(BaseTool):
         """Test database connection asynchronously."""
         try:
             # Convert dict back to DatabaseConnectionConfig
-            config = DatabaseConnectionConfig(**connection_config)
+            config = DatabaseConnectionConfig.model_validate(connection_config)
             
             logger.info(f"Testing connection to {config.database_type.value} at {config.host}:{config.port}")
             
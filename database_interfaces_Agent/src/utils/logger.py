@@ -5,7 +5,7 @@ Provides JSON formatting and proper configuration.
 
 import sys
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -17,7 +17,7 @@ project_root = Path(__file__).parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from config.settings import settings
+from config.settings import get_settings
 
 # Configure structlog
 structlog.configure(
@@ -39,6 +39,10 @@ structlog.configure(
 )
 
 
+# (level, format, root handlers) applied by the last setup_logging call
+_configured_key: Optional[Tuple[int, str, Tuple[logging.Handler, ...]]] = None
+
+
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """Get a structured logger instance."""
     return structlog.get_logger(name)
@@ -48,9 +52,15 @@ def setup_logging(
     log_level: Optional[str] = None,
     log_format: Optional[str] = None
 ) -> None:
-    """Setup logging configuration."""
+    """Setup logging configuration.
+    
+    Repeated calls with the same level and format, while the root logger
+    still has the handlers we last saw, are no-ops.
+    """
+    global _configured_key
     
     # Use settings if not provided
+    settings = get_settings()
     log_level = log_level or settings.log_level
     log_format = log_format or settings.log_format
     
@@ -64,6 +74,9 @@ def setup_logging(
     }
     
     log_level_constant = level_map.get(log_level.upper(), logging.INFO)
+    key = (log_level_constant, log_format, tuple(logging.getLogger().handlers))
+    if key == _configured_key:
+        return
     
     # Configure standard library logging
     logging.basicConfig(
@@ -89,6 +102,9 @@ def setup_logging(
     
     for logger_name in loggers_to_configure:
         logging.getLogger(logger_name).setLevel(log_level_constant)
+    
+    # Taken after basicConfig, which may have just installed the root handler
+    _configured_key = (log_level_constant, log_format, tuple(logging.getLogger().handlers))
 
 
 class AgentLogger:
@@ -98,6 +114,8 @@ class AgentLogger:
         self.agent_id = agent_id
         self.session_id = session_id
         self.logger = get_logger(f"agent.{agent_id}")
+        # Stdlib logger behind the structlog wrapper, for cheap level checks
+        self._level_logger = logging.getLogger(f"agent.{agent_id}")
     
     def _get_context(self, **kwargs) -> dict:
         """Get logging context."""
@@ -114,6 +132,8 @@ class AgentLogger:
     
     def info(self, message: str, **kwargs) -> None:
         """Log info message."""
+        if not self._level_logger.isEnabledFor(logging.INFO):
+            return
         context = self._get_context(**kwargs)
         self.logger.info(message, **context)
     
@@ -129,6 +149,8 @@ class AgentLogger:
     
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message."""
+        if not self._level_logger.isEnabledFor(logging.DEBUG):
+            return
         context = self._get_context(**kwargs)
         self.logger.debug(message, **context)
     